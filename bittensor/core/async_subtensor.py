@@ -1,6 +1,12 @@
 import asyncio
+import copy
+import functools
+import itertools
+import shelve
 import ssl
-from typing import Optional, Any, Union, TypedDict, Iterable
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Union, TypedDict, Iterable, Callable, Awaitable
 
 import aiohttp
 import numpy as np
@@ -9,19 +15,17 @@ from bittensor_wallet import Wallet
 from bittensor_wallet.utils import SS58_FORMAT
 from numpy.typing import NDArray
 from scalecodec import GenericCall
-from scalecodec.base import RuntimeConfiguration
-from scalecodec.type_registry import load_type_registry_preset
 from substrateinterface.exceptions import SubstrateRequestException
 
 from bittensor.core.chain_data import (
     DelegateInfo,
-    custom_rpc_type_registry,
     StakeInfo,
     NeuronInfoLite,
     NeuronInfo,
     SubnetHyperparameters,
     decode_account_id,
 )
+from bittensor.core.chain_data.utils import _get_rpc_runtime_config
 from bittensor.core.extrinsics.async_registration import register_extrinsic
 from bittensor.core.extrinsics.async_root import (
     set_root_weights_extrinsic,
@@ -33,6 +37,7 @@ from bittensor.core.extrinsics.async_weights import (
     set_weights_extrinsic,
 )
 from bittensor.core.settings import (
+    BLOCKTIME,
     TYPE_REGISTRY,
     DEFAULTS,
     NETWORK_MAP,
@@ -50,6 +55,7 @@ from bittensor.utils import (
 )
 from bittensor.utils.async_substrate_interface import (
     AsyncSubstrateInterface,
+    Runtime,
     TimeoutException,
 )
 from bittensor.utils.balance import Balance
@@ -83,6 +89,53 @@ class ProposalVoteData:
         return [decode_account_id(line[x][0]) for x in range(len(line))]
 
 
+# Owner of hotkeys that are not known to the chain.
+BURN_ADDRESS_SS58 = "5C4hrfjw9DjXZTzV3MwzrrAr9P1MJhSrvWGWqi1eSuyUpnhM"
+
+# Blocks at least this far behind the chain head are treated as final, so their hashes can be cached by number.
+FINALITY_DEPTH = 100
+
+# Seconds a looked-up chain head hash is reused for; far below the block time, so bursts share one lookup.
+CHAIN_HEAD_TTL = 0.5
+
+# Number of recently composed transfer calls kept by `AsyncSubtensor.get_transfer_fee`.
+TRANSFER_CALL_CACHE_SIZE = 128
+
+# Runtime API responses larger than this many bytes are decoded off the event loop.
+DECODE_IN_THREAD_THRESHOLD = 4096
+
+# Keys per `state_getKeysPaged` page for per-neuron maps; the node's upper limit, so a whole subnet fits in one page.
+NEURON_MAP_PAGE_SIZE = 1000
+
+
+async def _decode_vec_u8(decode: Callable[[bytes], Any], vec_u8: bytes) -> Any:
+    """Runs ``decode(vec_u8)``, in a worker thread when the payload is large enough to stall the event loop."""
+    if len(vec_u8) > DECODE_IN_THREAD_THRESHOLD:
+        return await asyncio.to_thread(decode, vec_u8)
+    return decode(vec_u8)
+
+
+def _strip_compact_prefix(vec_u8: bytes) -> bytes:
+    """Returns the contents of a SCALE encoded ``Vec<u8>``, dropping its compact length prefix."""
+    mode = vec_u8[0] & 0b11
+    prefix_length = (1, 2, 4, (vec_u8[0] >> 2) + 5)[mode]
+    return vec_u8[prefix_length:]
+
+
+@functools.lru_cache(maxsize=256)
+def _get_runtime_api_call(runtime_api: str, method: str) -> tuple[dict, str]:
+    """Returns the type registry definition and the ``state_call`` method name of a runtime API method."""
+    return (
+        TYPE_REGISTRY["runtime_api"][runtime_api]["methods"][method],
+        f"{runtime_api}_{method}",
+    )
+
+
+def _as_bytes(item: Union[bytes, bytearray, tuple]) -> Union[bytes, bytearray]:
+    """Returns ``item`` as a bytes-like object, only building a new buffer when it is a sequence of ints."""
+    return item if isinstance(item, (bytes, bytearray)) else bytes(item)
+
+
 def _decode_hex_identity_dict(info_dictionary: dict[str, Any]) -> dict[str, Any]:
     """Decodes a dictionary of hexadecimal identities."""
     for k, v in info_dictionary.items():
@@ -100,7 +153,7 @@ def _decode_hex_identity_dict(info_dictionary: dict[str, Any]) -> dict[str, Any]
                     logging.error(f"Could not decode: {k}: {item}.")
             else:
                 try:
-                    info_dictionary[k] = bytes(item[0]).decode("utf-8")
+                    info_dictionary[k] = _as_bytes(item[0]).decode("utf-8")
                 except UnicodeDecodeError:
                     logging.error(f"Could not decode: {k}: {item}.")
         else:
@@ -112,7 +165,13 @@ def _decode_hex_identity_dict(info_dictionary: dict[str, Any]) -> dict[str, Any]
 class AsyncSubtensor:
     """Thin layer for interacting with Substrate Interface. Mostly a collection of frequently-used calls."""
 
-    def __init__(self, network: str = DEFAULT_NETWORK):
+    def __init__(
+        self,
+        network: str = DEFAULT_NETWORK,
+        cache_size: int = 4096,
+        persistent_cache_path: Optional[str] = None,
+        max_concurrent_queries: int = 16,
+    ):
         if network in NETWORK_MAP:
             self.chain_endpoint = NETWORK_MAP[network]
             self.network = network
@@ -146,6 +205,26 @@ class AsyncSubtensor:
             type_registry=TYPE_REGISTRY,
             chain_name="Bittensor",
         )
+        # Chain state at a given block hash never changes, so reads pinned to a block hash are kept here.
+        self._block_cache: OrderedDict[tuple, Any] = OrderedDict()
+        self._block_cache_size = cache_size
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # Optional on-disk copy of the block cache, so block-pinned reads survive restarts.
+        self._persistent_cache_path = persistent_cache_path
+        self._disk_cache: Optional[shelve.Shelf] = None
+        self._param_scale_objs: dict[tuple[str, Optional[int]], Any] = {}
+        # Hashes of blocks far enough behind the last seen head that a reorg can no longer replace them.
+        self._final_block_hashes: dict[int, str] = {}
+        self._last_seen_block = 0
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        # Latest head pushed by the node, kept current by the header subscription of `watch_chain_head`.
+        self._head_watcher: Optional[asyncio.Task] = None
+        self._head_number: Optional[int] = None
+        self._head_seen_at = 0.0
+        self._chain_head: Optional[tuple[float, str]] = None
+        # Upper bound on requests a single fan-out method keeps in flight on the shared websocket.
+        self._max_concurrent_queries = max_concurrent_queries
+        self._transfer_calls: OrderedDict[tuple, GenericCall] = OrderedDict()
 
     def __str__(self):
         return f"Network: {self.network}, Chain: {self.chain_endpoint}"
@@ -156,6 +235,9 @@ class AsyncSubtensor:
         )
         try:
             async with self.substrate:
+                # Hold the websocket for the lifetime of this instance, so bursts of calls separated by more than
+                # the idle shutdown timer do not pay for a fresh TLS handshake each time.
+                await self.substrate.ws.__aenter__()
                 return self
         except TimeoutException:
             logging.error(
@@ -170,27 +252,196 @@ class AsyncSubtensor:
             raise ConnectionError
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop_watching_chain_head()
+        self.invalidate_block_cache()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+            self._disk_cache = None
+        if self._http_session is not None:
+            await self._http_session.close()
+            self._http_session = None
+        await self.substrate.ws.__aexit__(exc_type, exc_val, exc_tb)
         await self.substrate.close()
 
+    def _get_http_session(self) -> aiohttp.ClientSession:
+        """Returns the HTTP session used for off-chain requests, creating it on first use so connections are reused."""
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(10.0)
+            )
+        return self._http_session
+
+    def _get_disk_cache(self) -> Optional[shelve.Shelf]:
+        """
+        Returns the on-disk cache if one is configured, opening it on first use and again after ``__aexit__``.
+
+        Shelve reads and writes are synchronous and run on the event loop. They are local dbm lookups, far cheaper
+        than the RPCs they replace, and the dbm backends are not safe to use from several worker threads at once.
+        """
+        if self._disk_cache is None and self._persistent_cache_path:
+            self._disk_cache = shelve.open(self._persistent_cache_path)
+        return self._disk_cache
+
+    def invalidate_block_cache(self):
+        """Drops every cached chain read."""
+        self._block_cache.clear()
+        self._final_block_hashes.clear()
+        self._chain_head = None
+
+    async def _cached(
+        self,
+        key: tuple,
+        block_hash: Optional[str],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Returns the result of ``fetch()``, caching it per ``key`` and ``block_hash``.
+
+        Only reads pinned to an explicit block hash are cached, since the chain head moves between calls. Concurrent
+        calls with the same key share a single in-flight request instead of each issuing their own.
+
+        Args:
+            key (tuple): Identifies the read, e.g. ``(method_name, *params)``.
+            block_hash (Optional[str]): The block hash the read is pinned to.
+            fetch (Callable[[], Awaitable[Any]]): Performs the read on a cache miss.
+
+        Returns:
+            The cached or freshly fetched result.
+        """
+        key = (*key, block_hash)
+        if block_hash is not None:
+            if key not in self._block_cache and (
+                (disk_cache := self._get_disk_cache()) is not None
+            ):
+                if (disk_key := repr(key)) in disk_cache:
+                    self._remember(key, disk_cache[disk_key])
+            if key in self._block_cache:
+                self._block_cache.move_to_end(key)
+                # Keep `reuse_block` semantics identical to an uncached substrate read.
+                self.substrate.last_block_hash = block_hash
+                return self._block_cache[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = self._start_fetch(key, block_hash, fetch)
+        # Shielded so that one cancelled caller does not cancel the request for the others.
+        return await asyncio.shield(task)
+
+    def _remember(self, key: tuple, value: Any):
+        """Stores a block-pinned read in the in-memory cache, evicting the least recently used entry when full."""
+        self._block_cache[key] = value
+        if len(self._block_cache) > self._block_cache_size:
+            self._block_cache.popitem(last=False)
+
+    def _start_fetch(
+        self,
+        key: tuple,
+        block_hash: Optional[str],
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Future:
+        """Schedules ``fetch()`` as the in-flight read for ``key``, caching its result once it completes."""
+        task = asyncio.ensure_future(fetch())
+        self._inflight[key] = task
+
+        def _done(_task: asyncio.Future):
+            # Failed reads are evicted too, so the next call retries them.
+            self._inflight.pop(key, None)
+            if _task.cancelled():
+                return
+            # Retrieving the exception here keeps a failed prefetch nobody awaits from going unreported.
+            if (error := _task.exception()) is not None:
+                logging.debug(f"Read {key} failed: {error}")
+                return
+            if block_hash is None:
+                return
+            result = _task.result()
+            self._remember(key, result)
+            # Only plain values are persisted; decoded scale objects hold references to the live runtime.
+            if isinstance(result, (str, bytes, int, type(None))) and (
+                (disk_cache := self._get_disk_cache()) is not None
+            ):
+                disk_cache[repr(key)] = result
+
+        task.add_done_callback(_done)
+        return task
+
+    def prefetch_hyperparameters(
+        self, param_names: Iterable[str], netuids: Iterable[int], block_hash: str
+    ):
+        """
+        Starts fetching hyperparameters of several subnets at a block without waiting for them.
+
+        Later :meth:`get_hyperparameter` and :meth:`get_hyperparameters` calls at the same block hash await the
+        in-flight requests or read the cached results, so a known set of reads overlaps its network latency.
+
+        Args:
+            param_names (Iterable[str]): The names of the hyperparameters to fetch.
+            netuids (Iterable[int]): The unique identifiers of the subnets.
+            block_hash (str): The hash of the blockchain block the reads are pinned to.
+        """
+        param_names = list(param_names)
+        for netuid in netuids:
+            for param_name in param_names:
+                key = ("get_hyperparameter", param_name, netuid, block_hash)
+                if key in self._block_cache or key in self._inflight:
+                    continue
+                self._start_fetch(
+                    key,
+                    block_hash,
+                    functools.partial(
+                        self.substrate.query,
+                        module="SubtensorModule",
+                        storage_function=param_name,
+                        params=[netuid],
+                        block_hash=block_hash,
+                    ),
+                )
+
     async def encode_params(
         self,
         call_definition: dict[str, list["ParamWithTypes"]],
         params: Union[list[Any], dict[str, Any]],
     ) -> str:
         """Returns a hex encoded string of the params using their types."""
-        param_data = scalecodec.ScaleBytes(b"")
+        if not call_definition["params"]:
+            return "0x"
 
+        # Appending to one bytearray avoids the copy ScaleBytes makes on every `+`.
+        param_data = bytearray()
+
+        runtime = await self.substrate.init_runtime()
         for i, param in enumerate(call_definition["params"]):
-            scale_obj = await self.substrate.create_scale_object(param["type"])
+            scale_obj = self._get_param_scale_object(runtime, param["type"])
             if isinstance(params, list):
-                param_data += scale_obj.encode(params[i])
+                param_data += scale_obj.encode(params[i]).data
             else:
                 if param["name"] not in params:
                     raise ValueError(f"Missing param {param['name']} in params dict.")
 
-                param_data += scale_obj.encode(params[param["name"]])
+                param_data += scale_obj.encode(params[param["name"]]).data
+
+        return "0x" + param_data.hex()
 
-        return param_data.to_hex()
+    def _determine_block_hash(
+        self, block_hash: Optional[str], reuse_block: bool
+    ) -> Optional[str]:
+        """Returns the block hash a query should run at: the given one, the last-used one if ``reuse_block``, or ``None`` for the chain head."""
+        if block_hash:
+            return block_hash
+        if not reuse_block:
+            return None
+        return self.substrate.last_block_hash
+
+    def _get_param_scale_object(self, runtime: Runtime, type_string: str):
+        """Returns the scale object used to encode params of ``type_string``, reusing it while the runtime is unchanged."""
+        key = (type_string, self.substrate.runtime_version)
+        scale_obj = self._param_scale_objs.get(key)
+        if scale_obj is None:
+            scale_obj = runtime.runtime_config.create_scale_object(
+                type_string, metadata=runtime.metadata
+            )
+            self._param_scale_objs[key] = scale_obj
+        return scale_obj
 
     async def get_current_block(self) -> int:
         """
@@ -201,7 +452,51 @@ class AsyncSubtensor:
 
         Knowing the current block number is essential for querying real-time data and performing time-sensitive operations on the blockchain. It serves as a reference point for network activities and data synchronization.
         """
-        return await self.substrate.get_block_number()
+        if (
+            self._head_number is not None
+            and time.monotonic() - self._head_seen_at < BLOCKTIME
+        ):
+            return self._head_number
+        # The chain head moves, so concurrent calls are coalesced but the result is not cached.
+        block_number = await self._cached(
+            ("get_current_block",), None, self.substrate.get_block_number
+        )
+        self._last_seen_block = block_number
+        return block_number
+
+    def watch_chain_head(self):
+        """
+        Starts a new-head subscription, so that :meth:`get_current_block` is answered from the pushed head.
+
+        The subscription runs until :meth:`stop_watching_chain_head` or ``__aexit__``. If it fails, the error is
+        logged and ``get_current_block`` falls back to querying the node; call this again to restart it.
+        """
+        if self._head_watcher is None or self._head_watcher.done():
+            self._head_watcher = asyncio.create_task(self._run_head_watcher())
+
+    async def stop_watching_chain_head(self):
+        """Cancels the subscription started by :meth:`watch_chain_head` and waits for it to finish."""
+        watcher, self._head_watcher = self._head_watcher, None
+        self._head_number = None
+        if watcher is None:
+            return
+        watcher.cancel()
+        try:
+            await watcher
+        except asyncio.CancelledError:
+            pass
+
+    async def _run_head_watcher(self):
+        def on_new_head(block: dict, update_nr: int, subscription_id: str):
+            self._head_number = block["header"]["number"]
+            self._head_seen_at = time.monotonic()
+            self._last_seen_block = self._head_number
+
+        try:
+            await self.substrate.subscribe_block_headers(on_new_head)
+        except Exception as e:
+            # Callers fall back to polling the node until the subscription is restarted.
+            logging.warning(f"Chain head subscription stopped: {e}")
 
     async def get_block_hash(self, block_id: Optional[int] = None):
         """
@@ -216,9 +511,58 @@ class AsyncSubtensor:
         The block hash is a fundamental aspect of blockchain technology, providing a secure reference to each block's data. It is crucial for verifying transactions, ensuring data consistency, and maintaining the trustworthiness of the blockchain.
         """
         if block_id:
-            return await self.substrate.get_block_hash(block_id)
+            if (block_hash := self._final_block_hashes.get(block_id)) is not None:
+                return block_hash
+            block_hash = await self._cached(
+                ("get_block_hash", block_id),
+                None,
+                lambda: self.substrate.get_block_hash(block_id),
+            )
+            if block_id <= self._last_seen_block - FINALITY_DEPTH:
+                self._final_block_hashes[block_id] = block_hash
+            return block_hash
         else:
-            return await self.substrate.get_chain_head()
+            if (
+                self._chain_head is not None
+                and time.monotonic() - self._chain_head[0] < CHAIN_HEAD_TTL
+            ):
+                # Keep `reuse_block` semantics identical to a fresh head lookup.
+                self.substrate.last_block_hash = self._chain_head[1]
+                return self._chain_head[1]
+            block_hash = await self._cached(
+                ("get_chain_head",), None, self.substrate.get_chain_head
+            )
+            self._chain_head = (time.monotonic(), block_hash)
+            return block_hash
+
+    async def bulk_query(
+        self,
+        requests: Iterable[tuple[str, dict[str, Any]]],
+        block_hash: Optional[str] = None,
+        reuse_block: bool = False,
+    ) -> list[Any]:
+        """
+        Runs several read methods of this class concurrently, all pinned to the same block.
+
+        Args:
+            requests (Iterable[tuple[str, dict[str, Any]]]): ``(method_name, kwargs)`` pairs, e.g. ``("get_subnet_hyperparameters", {"netuid": 1})``. Each method must accept a ``block_hash`` argument.
+            block_hash (Optional[str]): The hash of the block to query at. If ``None``, the current chain head is looked up once and used for every request.
+            reuse_block (bool): Whether to reuse the last-used block hash.
+
+        Returns:
+            list[Any]: The results, in the same order as ``requests``.
+
+        Prefer this over awaiting the methods one after another: the requests are sent together instead of each waiting for the previous response, and every result reflects the same chain state.
+        """
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        if block_hash is None:
+            block_hash = await self.get_block_hash()
+        return await asyncio.gather(
+            *[
+                getattr(self, method)(**kwargs, block_hash=block_hash)
+                for method, kwargs in requests
+            ]
+        )
 
     async def is_hotkey_registered_any(
         self, hotkey_ss58: str, block_hash: Optional[str] = None
@@ -235,7 +579,17 @@ class AsyncSubtensor:
 
         This function is essential for determining the network-wide presence and participation of a neuron.
         """
-        return len(await self.get_netuids_for_hotkey(hotkey_ss58, block_hash)) > 0
+        result = await self.substrate.query_map(
+            module="SubtensorModule",
+            storage_function="IsNetworkMember",
+            params=[hotkey_ss58],
+            block_hash=block_hash,
+        )
+        # Stop at the first subnet the hotkey belongs to instead of loading every page of memberships.
+        async for _, is_member in result:
+            if is_member:
+                return True
+        return False
 
     async def get_subnet_burn_cost(
         self, block_hash: Optional[str] = None
@@ -274,11 +628,15 @@ class AsyncSubtensor:
 
         Understanding the total number of subnets is essential for assessing the network's growth and the extent of its decentralized infrastructure.
         """
-        result = await self.substrate.query(
-            module="SubtensorModule",
-            storage_function="TotalNetworks",
-            params=[],
-            block_hash=block_hash,
+        result = await self._cached(
+            ("get_total_subnets",),
+            block_hash,
+            lambda: self.substrate.query(
+                module="SubtensorModule",
+                storage_function="TotalNetworks",
+                params=[],
+                block_hash=block_hash,
+            ),
         )
         return result
 
@@ -295,17 +653,24 @@ class AsyncSubtensor:
         This function provides a comprehensive view of the subnets within the Bittensor network,
         offering insights into its diversity and scale.
         """
-        result = await self.substrate.query_map(
-            module="SubtensorModule",
-            storage_function="NetworksAdded",
-            block_hash=block_hash,
-            reuse_block_hash=True,
-        )
-        return (
-            []
-            if result is None or not hasattr(result, "records")
-            else [netuid async for netuid, exists in result if exists]
-        )
+
+        async def fetch_subnets() -> tuple[int, ...]:
+            result = await self.substrate.query_map(
+                module="SubtensorModule",
+                storage_function="NetworksAdded",
+                block_hash=block_hash,
+                reuse_block_hash=True,
+            )
+            return (
+                ()
+                if result is None or not hasattr(result, "records")
+                else tuple(
+                    netuid for netuid, exists in await result.fetch_all() if exists
+                )
+            )
+
+        # Cached as a tuple so callers get their own list to mutate.
+        return list(await self._cached(("get_subnets",), block_hash, fetch_subnets))
 
     async def is_hotkey_delegate(
         self,
@@ -326,10 +691,19 @@ class AsyncSubtensor:
 
         Being a delegate is a significant status within the Bittensor network, indicating a neuron's involvement in consensus and governance processes.
         """
-        delegates = await self.get_delegates(
-            block_hash=block_hash, reuse_block=reuse_block
+
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+
+        async def fetch_delegate_hotkeys() -> frozenset[str]:
+            delegates = await self.get_delegates(block_hash=block_hash)
+            return frozenset(info.hotkey_ss58 for info in delegates)
+
+        delegate_hotkeys = await self._cached(
+            ("delegate_hotkeys",),
+            block_hash,
+            fetch_delegate_hotkeys,
         )
-        return hotkey_ss58 in [info.hotkey_ss58 for info in delegates]
+        return hotkey_ss58 in delegate_hotkeys
 
     async def get_delegates(
         self, block_hash: Optional[str] = None, reuse_block: bool = False
@@ -344,15 +718,21 @@ class AsyncSubtensor:
         Returns:
             List of DelegateInfo objects, or an empty list if there are no delegates.
         """
-        hex_bytes_result = await self.query_runtime_api(
-            runtime_api="DelegateInfoRuntimeApi",
-            method="get_delegates",
-            params=[],
-            block_hash=block_hash,
-            reuse_block=reuse_block,
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        hex_bytes_result = await self._cached(
+            ("get_delegates",),
+            block_hash,
+            lambda: self.query_runtime_api(
+                runtime_api="DelegateInfoRuntimeApi",
+                method="get_delegates",
+                params=[],
+                block_hash=block_hash,
+            ),
         )
         if hex_bytes_result is not None:
-            return DelegateInfo.list_from_vec_u8(hex_to_bytes(hex_bytes_result))
+            return await _decode_vec_u8(
+                DelegateInfo.list_from_vec_u8, hex_to_bytes(hex_bytes_result)
+            )
         else:
             return []
 
@@ -419,7 +799,8 @@ class AsyncSubtensor:
         params: Optional[Union[list[list[int]], dict[str, int], list[int]]],
         block_hash: Optional[str] = None,
         reuse_block: bool = False,
-    ) -> Optional[str]:
+        raw: bool = False,
+    ) -> Optional[Union[str, bytes]]:
         """
         Queries the runtime API of the Bittensor blockchain, providing a way to interact with the underlying runtime and retrieve data encoded in Scale Bytes format. This function is essential for advanced users who need to interact with specific runtime methods and decode complex data types.
 
@@ -429,44 +810,111 @@ class AsyncSubtensor:
             params (Optional[Union[list[list[int]], dict[str, int]]]): The parameters to pass to the method call.
             block_hash (Optional[str]): The hash of the blockchain block number at which to perform the query.
             reuse_block (bool): Whether to reuse the last-used block hash.
+            raw (bool): For methods returning ``Vec<u8>``, return the bytes themselves instead of their hex string.
 
         Returns:
             The Scale Bytes encoded result from the runtime API call, or ``None`` if the call fails.
 
         This function enables access to the deeper layers of the Bittensor blockchain, allowing for detailed and specific interactions with the network's runtime environment.
         """
-        call_definition = TYPE_REGISTRY["runtime_api"][runtime_api]["methods"][method]
+        call_definition, api_method, data = await self._encode_runtime_api_call(
+            runtime_api, method, params
+        )
+
+        json_result = await self.substrate.rpc_request(
+            method="state_call",
+            params=[api_method, data, block_hash] if block_hash else [api_method, data],
+            reuse_block_hash=reuse_block,
+        )
+
+        return await self._decode_runtime_api_result(call_definition, json_result, raw)
+
+    async def query_runtime_api_batch(
+        self,
+        calls: list[
+            tuple[str, str, Optional[Union[list[list[int]], dict[str, int], list[int]]]]
+        ],
+        block_hash: Optional[str] = None,
+        reuse_block: bool = False,
+    ) -> list[Optional[str]]:
+        """
+        Queries several runtime API methods at the same block, sending every request before awaiting the responses.
+
+        Args:
+            calls (list[tuple[str, str, Optional[Union[list[list[int]], dict[str, int], list[int]]]]]): ``(runtime_api, method, params)`` tuples, as passed to :meth:`query_runtime_api`.
+            block_hash (Optional[str]): The hash of the blockchain block number at which to perform the queries. If ``None``, the current chain head is looked up once and used for every call.
+            reuse_block (bool): Whether to reuse the last-used block hash.
+
+        Returns:
+            The decoded result of each call, in the same order as ``calls``.
+        """
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        if block_hash is None:
+            block_hash = await self.get_block_hash()
+        encoded = await asyncio.gather(
+            *[
+                self._encode_runtime_api_call(runtime_api, method, params)
+                for runtime_api, method, params in calls
+            ]
+        )
+        json_results = await self.substrate.rpc_batch_request(
+            [("state_call", [api_method, data]) for _, api_method, data in encoded],
+            block_hash=block_hash,
+        )
+        return await asyncio.gather(
+            *[
+                self._decode_runtime_api_result(call_definition, json_result)
+                for (call_definition, _, _), json_result in zip(encoded, json_results)
+            ]
+        )
+
+    async def _encode_runtime_api_call(
+        self,
+        runtime_api: str,
+        method: str,
+        params: Optional[Union[list[list[int]], dict[str, int], list[int]]],
+    ) -> tuple[dict, str, str]:
+        """Returns the call definition, the ``state_call`` method name and the encoded params of a runtime API call."""
+        call_definition, api_method = _get_runtime_api_call(runtime_api, method)
 
         data = (
             "0x"
-            if params is None
+            if params is None or not call_definition["params"]
             else await self.encode_params(
                 call_definition=call_definition, params=params
             )
         )
-        api_method = f"{runtime_api}_{method}"
+        return call_definition, api_method, data
 
-        json_result = await self.substrate.rpc_request(
-            method="state_call",
-            params=[api_method, data, block_hash] if block_hash else [api_method, data],
-            reuse_block_hash=reuse_block,
-        )
+    @staticmethod
+    async def _decode_runtime_api_result(
+        call_definition: dict, json_result: Optional[dict], raw: bool = False
+    ) -> Optional[Union[str, bytes]]:
+        """
+        Decodes a ``state_call`` response using the return type of the runtime API call definition.
 
+        Large responses are decoded in a worker thread, so that the event loop keeps serving other requests meanwhile.
+        With ``raw``, a ``Vec<u8>`` response is returned as bytes without being decoded into a hex string at all.
+        """
         if json_result is None:
             return None
 
+        if raw:
+            vec_u8 = hex_to_bytes(json_result["result"])
+            if vec_u8 == b"\x04\x00":  # RPC returned None result
+                return None
+            return _strip_compact_prefix(vec_u8)
+
         return_type = call_definition["type"]
 
         as_scale_bytes = scalecodec.ScaleBytes(json_result["result"])
 
-        rpc_runtime_config = RuntimeConfiguration()
-        rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
-        rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
-
-        obj = rpc_runtime_config.create_scale_object(return_type, as_scale_bytes)
-        if obj.data.to_hex() == "0x0400":  # RPC returned None result
+        obj = _get_rpc_runtime_config().create_scale_object(return_type, as_scale_bytes)
+        if obj.data.data == b"\x04\x00":  # RPC returned None result
             return None
 
+        if len(obj.data.data) > DECODE_IN_THREAD_THRESHOLD:
+            return await asyncio.to_thread(obj.decode)
         return obj.decode()
 
     async def get_balance(
@@ -484,20 +932,29 @@ class AsyncSubtensor:
         Returns:
             Dict of {address: Balance objects}.
         """
-        calls = [
-            (
-                await self.substrate.create_storage_key(
-                    "System", "Account", [address], block_hash=block_hash
-                )
+        if len(addresses) == 1:
+            # A single account needs no storage-key batch, one plain query will do.
+            address = addresses[0]
+            value = await self.substrate.query(
+                module="System",
+                storage_function="Account",
+                params=[address],
+                block_hash=block_hash,
             )
-            for address in addresses
-        ]
+            value = value or {"data": {"free": 0}}
+            return {address: Balance(value["data"]["free"])}
+
+        calls = await self.substrate.create_storage_keys(
+            "System",
+            "Account",
+            [[address] for address in addresses],
+            block_hash=block_hash,
+        )
         batch_call = await self.substrate.query_multi(calls, block_hash=block_hash)
-        results = {}
-        for item in batch_call:
-            value = item[1] or {"data": {"free": 0}}
-            results.update({item[0].params[0]: Balance(value["data"]["free"])})
-        return results
+        return {
+            storage_key.params[0]: Balance(value["data"]["free"] if value else 0)
+            for storage_key, value in batch_call
+        }
 
     async def get_transfer_fee(
         self, wallet: "Wallet", dest: str, value: Union["Balance", float, int]
@@ -519,26 +976,7 @@ class AsyncSubtensor:
             value = Balance.from_tao(value)
         elif isinstance(value, int):
             value = Balance.from_rao(value)
-
-        if isinstance(value, Balance):
-            call = await self.substrate.compose_call(
-                call_module="Balances",
-                call_function="transfer_allow_death",
-                call_params={"dest": dest, "value": value.rao},
-            )
-
-            try:
-                payment_info = await self.substrate.get_payment_info(
-                    call=call, keypair=wallet.coldkeypub
-                )
-            except Exception as e:
-                logging.error(
-                    f":cross_mark: <red>Failed to get payment info: </red>{e}"
-                )
-                payment_info = {"partialFee": int(2e7)}  # assume  0.02 Tao
-
-            return Balance.from_rao(payment_info["partialFee"])
-        else:
+        elif not isinstance(value, Balance):
             fee = Balance.from_rao(int(2e7))
             logging.error(
                 "To calculate the transaction fee, the value must be Balance, float, or int. Received type: %s. Fee "
@@ -548,6 +986,28 @@ class AsyncSubtensor:
             )
             return fee
 
+        # Only the composed call is reused; the fee itself depends on the block and the sender.
+        call_key = (dest, value.rao, self.substrate.runtime_version)
+        if (call := self._transfer_calls.get(call_key)) is None:
+            call = await self.substrate.compose_call(
+                call_module="Balances",
+                call_function="transfer_allow_death",
+                call_params={"dest": dest, "value": value.rao},
+            )
+            self._transfer_calls[call_key] = call
+            if len(self._transfer_calls) > TRANSFER_CALL_CACHE_SIZE:
+                self._transfer_calls.popitem(last=False)
+
+        try:
+            payment_info = await self.substrate.get_payment_info(
+                call=call, keypair=wallet.coldkeypub
+            )
+        except Exception as e:
+            logging.error(f":cross_mark: <red>Failed to get payment info: </red>{e}")
+            return Balance.from_rao(int(2e7))  # assume  0.02 Tao
+
+        return Balance.from_rao(payment_info["partialFee"])
+
     async def get_total_stake_for_coldkey(
         self,
         *ss58_addresses,
@@ -563,29 +1023,25 @@ class AsyncSubtensor:
         Returns:
             Dict in view {address: Balance objects}.
         """
-        calls = [
-            (
-                await self.substrate.create_storage_key(
-                    "SubtensorModule",
-                    "TotalColdkeyStake",
-                    [address],
-                    block_hash=block_hash,
-                )
-            )
-            for address in ss58_addresses
-        ]
+        calls = await self.substrate.create_storage_keys(
+            "SubtensorModule",
+            "TotalColdkeyStake",
+            [[address] for address in ss58_addresses],
+            block_hash=block_hash,
+        )
         batch_call = await self.substrate.query_multi(calls, block_hash=block_hash)
-        results = {}
-        for item in batch_call:
-            results.update({item[0].params[0]: Balance.from_rao(item[1] or 0)})
-        return results
+        return {
+            storage_key.params[0]: Balance.from_rao(value or 0)
+            for storage_key, value in batch_call
+        }
 
     async def get_total_stake_for_hotkey(
         self,
         *ss58_addresses,
         block_hash: Optional[str] = None,
         reuse_block: bool = False,
-    ) -> dict[str, Balance]:
+        raw: bool = False,
+    ) -> Union[dict[str, Balance], dict[str, int]]:
         """
         Returns the total stake held on a hotkey.
 
@@ -593,9 +1049,10 @@ class AsyncSubtensor:
             ss58_addresses (tuple[str]): The SS58 address(es) of the hotkey(s)
             block_hash (str): The hash of the block number to retrieve the stake from.
             reuse_block (bool): Whether to reuse the last-used block hash when retrieving info.
+            raw (bool): Return the stakes as plain rao integers instead of Balance objects, e.g. when summing many of them.
 
         Returns:
-            Dict {address: Balance objects}.
+            Dict {address: Balance objects}, or {address: rao} if ``raw``.
         """
         results = await self.substrate.query_multiple(
             params=[s for s in ss58_addresses],
@@ -604,6 +1061,8 @@ class AsyncSubtensor:
             block_hash=block_hash,
             reuse_block_hash=reuse_block,
         )
+        if raw:
+            return {k: int(r or 0) for (k, r) in results.items()}
         return {k: Balance.from_rao(r or 0) for (k, r) in results.items()}
 
     async def get_netuids_for_hotkey(
@@ -624,18 +1083,32 @@ class AsyncSubtensor:
             A list of netuids where the neuron is a member.
         """
 
-        result = await self.substrate.query_map(
-            module="SubtensorModule",
-            storage_function="IsNetworkMember",
-            params=[hotkey_ss58],
-            block_hash=block_hash,
-            reuse_block_hash=reuse_block,
-        )
-        return (
-            [record[0] async for record in result if record[1]]
-            if result and hasattr(result, "records")
-            else []
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+
+        async def fetch_netuids() -> tuple[int, ...]:
+            result = await self.substrate.query_map(
+                module="SubtensorModule",
+                storage_function="IsNetworkMember",
+                params=[hotkey_ss58],
+                block_hash=block_hash,
+            )
+            return (
+                tuple(
+                    netuid
+                    for netuid, is_member in await result.fetch_all()
+                    if is_member
+                )
+                if result and hasattr(result, "records")
+                else ()
+            )
+
+        # Cached as a tuple so callers get their own list to mutate.
+        netuids = await self._cached(
+            ("get_netuids_for_hotkey", hotkey_ss58),
+            block_hash,
+            fetch_netuids,
         )
+        return list(netuids)
 
     async def subnet_exists(
         self, netuid: int, block_hash: Optional[str] = None, reuse_block: bool = False
@@ -654,12 +1127,16 @@ class AsyncSubtensor:
         This function is critical for verifying the presence of specific subnets in the network,
         enabling a deeper understanding of the network's structure and composition.
         """
-        result = await self.substrate.query(
-            module="SubtensorModule",
-            storage_function="NetworksAdded",
-            params=[netuid],
-            block_hash=block_hash,
-            reuse_block_hash=reuse_block,
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        result = await self._cached(
+            ("subnet_exists", netuid),
+            block_hash,
+            lambda: self.substrate.query(
+                module="SubtensorModule",
+                storage_function="NetworksAdded",
+                params=[netuid],
+                block_hash=block_hash,
+            ),
         )
         return result
 
@@ -686,15 +1163,65 @@ class AsyncSubtensor:
             print("subnet does not exist")
             return None
 
-        result = await self.substrate.query(
-            module="SubtensorModule",
-            storage_function=param_name,
-            params=[netuid],
-            block_hash=block_hash,
-            reuse_block_hash=reuse_block,
+        return await self._query_hyperparameter(
+            param_name, netuid, block_hash, reuse_block
         )
 
-        return result
+    async def get_hyperparameters(
+        self,
+        param_names: list[str],
+        netuid: int,
+        block_hash: Optional[str] = None,
+        reuse_block: bool = False,
+    ) -> Optional[dict[str, Any]]:
+        """
+        Retrieves several hyperparameters of a specific subnet at the same block, checking the subnet exists only once.
+
+        Args:
+            param_names (list[str]): The names of the hyperparameters to retrieve.
+            netuid (int): The unique identifier of the subnet.
+            block_hash (Optional[str]): The hash of blockchain block number for the query.
+            reuse_block (bool): Whether to reuse the last-used block hash.
+
+        Returns:
+            A dictionary mapping each hyperparameter name to its value if the subnet exists, or None
+        """
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        if block_hash is None:
+            # Pin every query to one head so the runtime is resolved once and the
+            # pipelined queries are served from (and stored in) the block cache.
+            block_hash = await self.get_block_hash()
+        if not await self.subnet_exists(netuid, block_hash):
+            logging.debug(f"Subnet {netuid} does not exist.")
+            return None
+
+        results = await asyncio.gather(
+            *[
+                self._query_hyperparameter(param_name, netuid, block_hash)
+                for param_name in param_names
+            ]
+        )
+        return dict(zip(param_names, results))
+
+    async def _query_hyperparameter(
+        self,
+        param_name: str,
+        netuid: int,
+        block_hash: Optional[str] = None,
+        reuse_block: bool = False,
+    ) -> Optional[Any]:
+        """Queries a subnet hyperparameter without checking that the subnet exists."""
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        return await self._cached(
+            ("get_hyperparameter", param_name, netuid),
+            block_hash,
+            lambda: self.substrate.query(
+                module="SubtensorModule",
+                storage_function=param_name,
+                params=[netuid],
+                block_hash=block_hash,
+            ),
+        )
 
     async def filter_netuids_by_registered_hotkeys(
         self,
@@ -717,39 +1244,33 @@ class AsyncSubtensor:
         Returns:
             The filtered list of netuids.
         """
-        netuids_with_registered_hotkeys = [
-            item
-            for sublist in await asyncio.gather(
-                *[
-                    self.get_netuids_for_hotkey(
-                        wallet.hotkey.ss58_address,
-                        reuse_block=reuse_block,
-                        block_hash=block_hash,
-                    )
-                    for wallet in all_hotkeys
-                ]
-            )
-            for item in sublist
-        ]
-
-        if not filter_for_netuids:
-            all_netuids = netuids_with_registered_hotkeys
+        semaphore = asyncio.Semaphore(self._max_concurrent_queries)
 
-        else:
-            filtered_netuids = [
-                netuid for netuid in all_netuids if netuid in filter_for_netuids
-            ]
+        async def netuids_for_wallet(wallet: Wallet) -> list[int]:
+            async with semaphore:
+                return await self.get_netuids_for_hotkey(
+                    wallet.hotkey.ss58_address,
+                    reuse_block=reuse_block,
+                    block_hash=block_hash,
+                )
 
-            registered_hotkeys_filtered = [
-                netuid
-                for netuid in netuids_with_registered_hotkeys
-                if netuid in filter_for_netuids
-            ]
+        netuids_with_registered_hotkeys = frozenset(
+            itertools.chain.from_iterable(
+                await asyncio.gather(
+                    *[netuids_for_wallet(wallet) for wallet in all_hotkeys]
+                )
+            )
+        )
+        filter_for_netuids = frozenset(filter_for_netuids or ())
 
-            # Combine both filtered lists
-            all_netuids = filtered_netuids + registered_hotkeys_filtered
+        if not filter_for_netuids:
+            return list(netuids_with_registered_hotkeys)
 
-        return list(set(all_netuids))
+        # Netuids of interest that are either known or have one of the hotkeys registered
+        return list(
+            (frozenset(all_netuids) | netuids_with_registered_hotkeys)
+            & filter_for_netuids
+        )
 
     async def get_existential_deposit(
         self, block_hash: Optional[str] = None, reuse_block: bool = False
@@ -768,11 +1289,15 @@ class AsyncSubtensor:
 
         The existential deposit is a fundamental economic parameter in the Bittensor network, ensuring efficient use of storage and preventing the proliferation of dust accounts.
         """
-        result = await self.substrate.get_constant(
-            module_name="Balances",
-            constant_name="ExistentialDeposit",
-            block_hash=block_hash,
-            reuse_block_hash=reuse_block,
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        result = await self._cached(
+            ("get_existential_deposit",),
+            block_hash,
+            lambda: self.substrate.get_constant(
+                module_name="Balances",
+                constant_name="ExistentialDeposit",
+                block_hash=block_hash,
+            ),
         )
 
         if result is None:
@@ -831,20 +1356,25 @@ class AsyncSubtensor:
 
         This function offers a quick overview of the neuron population within a subnet, facilitating efficient analysis of the network's decentralized structure and neuron dynamics.
         """
-        hex_bytes_result = await self.query_runtime_api(
-            runtime_api="NeuronInfoRuntimeApi",
-            method="get_neurons_lite",
-            params=[
-                netuid
-            ],  # TODO check to see if this can accept more than one at a time
-            block_hash=block_hash,
-            reuse_block=reuse_block,
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        bytes_result = await self._cached(
+            ("neurons_lite", netuid),
+            block_hash,
+            lambda: self.query_runtime_api(
+                runtime_api="NeuronInfoRuntimeApi",
+                method="get_neurons_lite",
+                params=[
+                    netuid
+                ],  # TODO check to see if this can accept more than one at a time
+                block_hash=block_hash,
+                raw=True,
+            ),
         )
 
-        if hex_bytes_result is None:
+        if bytes_result is None:
             return []
 
-        return NeuronInfoLite.list_from_vec_u8(hex_to_bytes(hex_bytes_result))
+        return await _decode_vec_u8(NeuronInfoLite.list_from_vec_u8, bytes_result)
 
     async def neuron_for_uid(
         self, uid: Optional[int], netuid: int, block_hash: Optional[str] = None
@@ -866,9 +1396,13 @@ class AsyncSubtensor:
             return NeuronInfo.get_null_neuron()
 
         params = [netuid, uid, block_hash] if block_hash else [netuid, uid]
-        json_body = await self.substrate.rpc_request(
-            method="neuronInfo_getNeuron",
-            params=params,  # custom rpc method
+        json_body = await self._cached(
+            ("neuron_for_uid", netuid, uid),
+            block_hash,
+            lambda: self.substrate.rpc_request(
+                method="neuronInfo_getNeuron",
+                params=params,  # custom rpc method
+            ),
         )
         if not (result := json_body.get("result", None)):
             return NeuronInfo.get_null_neuron()
@@ -896,21 +1430,25 @@ class AsyncSubtensor:
         This function is important for account holders to understand their stake allocations and their involvement in the network's delegation and consensus mechanisms.
         """
 
-        block_hash = (
-            block_hash
-            if block_hash
-            else (self.substrate.last_block_hash if reuse_block else None)
-        )
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
         encoded_coldkey = ss58_to_vec_u8(coldkey_ss58)
-        json_body = await self.substrate.rpc_request(
-            method="delegateInfo_getDelegated",
-            params=([block_hash, encoded_coldkey] if block_hash else [encoded_coldkey]),
+        json_body = await self._cached(
+            ("get_delegated", coldkey_ss58),
+            block_hash,
+            lambda: self.substrate.rpc_request(
+                method="delegateInfo_getDelegated",
+                params=(
+                    [block_hash, encoded_coldkey] if block_hash else [encoded_coldkey]
+                ),
+            ),
         )
 
         if not (result := json_body.get("result")):
             return []
 
-        return DelegateInfo.delegated_list_from_vec_u8(bytes(result))
+        return await _decode_vec_u8(
+            DelegateInfo.delegated_list_from_vec_u8, bytes(result)
+        )
 
     async def query_identity(
         self,
@@ -935,15 +1473,20 @@ class AsyncSubtensor:
             See the `Bittensor CLI documentation <https://docs.bittensor.com/reference/btcli>`_ for supported identity parameters.
         """
 
-        identity_info = await self.substrate.query(
-            module="Registry",
-            storage_function="IdentityOf",
-            params=[key],
-            block_hash=block_hash,
-            reuse_block_hash=reuse_block,
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        identity_info = await self._cached(
+            ("query_identity", key),
+            block_hash,
+            lambda: self.substrate.query(
+                module="Registry",
+                storage_function="IdentityOf",
+                params=[key],
+                block_hash=block_hash,
+            ),
         )
         try:
-            return _decode_hex_identity_dict(identity_info["info"])
+            # Decode a copy, since the cached identity is shared between callers.
+            return _decode_hex_identity_dict(dict(identity_info["info"]))
         except TypeError:
             return {}
 
@@ -963,16 +1506,61 @@ class AsyncSubtensor:
 
         The weight distribution is a key factor in the network's consensus algorithm and the ranking of neurons, influencing their influence and reward allocation within the subnet.
         """
-        # TODO look into seeing if we can speed this up with storage query
-        w_map_encoded = await self.substrate.query_map(
-            module="SubtensorModule",
-            storage_function="Weights",
-            params=[netuid],
-            block_hash=block_hash,
+
+        async def fetch_weights() -> (
+            tuple[tuple[int, tuple[tuple[int, int], ...]], ...]
+        ):
+            w_map_encoded = await self.substrate.query_map(
+                module="SubtensorModule",
+                storage_function="Weights",
+                params=[netuid],
+                block_hash=block_hash,
+                page_size=NEURON_MAP_PAGE_SIZE,
+            )
+            return tuple(
+                (uid, tuple(w or ())) for uid, w in await w_map_encoded.fetch_all()
+            )
+
+        # Cached as tuples so callers get their own lists to mutate.
+        w_map = await self._cached(("weights", netuid), block_hash, fetch_weights)
+        return [(uid, list(w)) for uid, w in w_map]
+
+    async def weights_csr(
+        self, netuid: int, block_hash: Optional[str] = None
+    ) -> tuple[NDArray[np.int64], NDArray[np.uint16], NDArray[np.uint16]]:
+        """
+        Retrieves the weights set within a subnet as a compressed sparse row (CSR) matrix.
+
+        Row ``uid`` holds the weights set by that neuron: its destination UIDs are
+        ``indices[indptr[uid]:indptr[uid + 1]]`` and the matching weights are the same slice of ``data``. This keeps
+        one array element per edge instead of a Python tuple, and can be passed straight to
+        ``scipy.sparse.csr_matrix((data, indices, indptr))``.
+
+        Args:
+            netuid (int): The network UID of the subnet to query.
+            block_hash (Optional[str]): The hash of the blockchain block for the query.
+
+        Returns:
+            A tuple of ``(indptr, indices, data)`` arrays.
+        """
+        w_map = sorted(
+            await self.weights(netuid=netuid, block_hash=block_hash),
+            key=lambda row: row[0],
         )
-        w_map = [(uid, w or []) async for uid, w in w_map_encoded]
 
-        return w_map
+        row_lengths = np.zeros(w_map[-1][0] + 1 if w_map else 0, dtype=np.int64)
+        for uid, w in w_map:
+            row_lengths[uid] = len(w)
+        indptr = np.zeros(len(row_lengths) + 1, dtype=np.int64)
+        np.cumsum(row_lengths, out=indptr[1:])
+
+        edges = itertools.chain.from_iterable(w for _, w in w_map)
+        pairs = np.fromiter(
+            itertools.chain.from_iterable(edges),
+            dtype=np.uint16,
+            count=2 * int(indptr[-1]),
+        ).reshape(-1, 2)
+        return indptr, pairs[:, 0].copy(), pairs[:, 1].copy()
 
     async def bonds(
         self, netuid: int, block_hash: Optional[str] = None
@@ -990,15 +1578,20 @@ class AsyncSubtensor:
 
         Understanding bond distributions is crucial for analyzing the trust dynamics and market behavior within the subnet. It reflects how neurons recognize and invest in each other's intelligence and contributions, supporting diverse and niche systems within the Bittensor ecosystem.
         """
-        b_map_encoded = await self.substrate.query_map(
-            module="SubtensorModule",
-            storage_function="Bonds",
-            params=[netuid],
-            block_hash=block_hash,
-        )
-        b_map = [(uid, b) async for uid, b in b_map_encoded]
 
-        return b_map
+        async def fetch_bonds() -> tuple[tuple[int, tuple[tuple[int, int], ...]], ...]:
+            b_map_encoded = await self.substrate.query_map(
+                module="SubtensorModule",
+                storage_function="Bonds",
+                params=[netuid],
+                block_hash=block_hash,
+                page_size=NEURON_MAP_PAGE_SIZE,
+            )
+            return tuple((uid, tuple(b)) for uid, b in await b_map_encoded.fetch_all())
+
+        # Cached as tuples so callers get their own lists to mutate.
+        b_map = await self._cached(("bonds", netuid), block_hash, fetch_bonds)
+        return [(uid, list(b)) for uid, b in b_map]
 
     async def does_hotkey_exist(
         self,
@@ -1017,20 +1610,28 @@ class AsyncSubtensor:
         Returns:
             `True` if the hotkey is known by the chain and there are accounts, `False` otherwise.
         """
-        _result = await self.substrate.query(
-            module="SubtensorModule",
-            storage_function="Owner",
-            params=[hotkey_ss58],
-            block_hash=block_hash,
-            reuse_block_hash=reuse_block,
-        )
+        _result = await self._query_owner(hotkey_ss58, block_hash, reuse_block)
         result = decode_account_id(_result[0])
-        return_val = (
-            False
-            if result is None
-            else result != "5C4hrfjw9DjXZTzV3MwzrrAr9P1MJhSrvWGWqi1eSuyUpnhM"
+        return result is not None and result != BURN_ADDRESS_SS58
+
+    async def _query_owner(
+        self,
+        hotkey_ss58: str,
+        block_hash: Optional[str] = None,
+        reuse_block: bool = False,
+    ):
+        """Queries the raw ``Owner`` storage entry of a hotkey, shared by the hotkey existence and owner lookups."""
+        block_hash = self._determine_block_hash(block_hash, reuse_block)
+        return await self._cached(
+            ("Owner", hotkey_ss58),
+            block_hash,
+            lambda: self.substrate.query(
+                module="SubtensorModule",
+                storage_function="Owner",
+                params=[hotkey_ss58],
+                block_hash=block_hash,
+            ),
         )
-        return return_val
 
     async def get_hotkey_owner(
         self, hotkey_ss58: str, block_hash: str
@@ -1046,19 +1647,12 @@ class AsyncSubtensor:
         Returns:
             Optional[str]: The SS58 address of the owner if the hotkey exists, or None if it doesn't.
         """
-        hk_owner_query = await self.substrate.query(
-            module="SubtensorModule",
-            storage_function="Owner",
-            params=[hotkey_ss58],
-            block_hash=block_hash,
-        )
+        hk_owner_query = await self._query_owner(hotkey_ss58, block_hash)
         val = decode_account_id(hk_owner_query[0])
-        if val:
-            exists = await self.does_hotkey_exist(hotkey_ss58, block_hash=block_hash)
-        else:
-            exists = False
-        hotkey_owner = val if exists else None
-        return hotkey_owner
+        # An unknown hotkey maps to the burn address, which is what does_hotkey_exist checks for.
+        if val and val != BURN_ADDRESS_SS58:
+            return val
+        return None
 
     async def sign_and_send_extrinsic(
         self,
@@ -1119,12 +1713,11 @@ class AsyncSubtensor:
                 params=[hotkey, netuid],
             )
             if children:
-                formatted_children = []
-                for proportion, child in children:
-                    # Convert U64 to int
-                    formatted_child = decode_account_id(child[0])
-                    int_proportion = int(proportion)
-                    formatted_children.append((int_proportion, formatted_child))
+                # Convert U64 proportions to int
+                formatted_children = [
+                    (int(proportion), decode_account_id(child[0]))
+                    for proportion, child in children
+                ]
                 return True, formatted_children, ""
             else:
                 return True, [], ""
@@ -1146,17 +1739,26 @@ class AsyncSubtensor:
 
         Understanding the hyperparameters is crucial for comprehending how subnets are configured and managed, and how they interact with the network's consensus and incentive mechanisms.
         """
-        hex_bytes_result = await self.query_runtime_api(
-            runtime_api="SubnetInfoRuntimeApi",
-            method="get_subnet_hyperparams",
-            params=[netuid],
-            block_hash=block_hash,
-        )
 
-        if hex_bytes_result is None:
-            return []
+        async def fetch_hyperparameters():
+            hex_bytes_result = await self.query_runtime_api(
+                runtime_api="SubnetInfoRuntimeApi",
+                method="get_subnet_hyperparams",
+                params=[netuid],
+                block_hash=block_hash,
+            )
+
+            if hex_bytes_result is None:
+                return []
 
-        return SubnetHyperparameters.from_vec_u8(hex_to_bytes(hex_bytes_result))
+            return SubnetHyperparameters.from_vec_u8(hex_to_bytes(hex_bytes_result))
+
+        # The decoded object is cached, so hits at a pinned block skip the SCALE decode as well as the RPC. It is shared
+        # between callers, so each gets a copy.
+        hyperparameters = await self._cached(
+            ("SubnetHyperparameters", netuid), block_hash, fetch_hyperparameters
+        )
+        return copy.copy(hyperparameters)
 
     async def get_vote_data(
         self,
@@ -1202,22 +1804,21 @@ class AsyncSubtensor:
             Dict {ss58: DelegatesDetails, ...}
 
         """
-        timeout = aiohttp.ClientTimeout(10.0)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            identities_info, response = await asyncio.gather(
-                self.substrate.query_map(
-                    module="Registry",
-                    storage_function="IdentityOf",
-                    block_hash=block_hash,
-                ),
-                session.get(DELEGATES_DETAILS_URL),
-            )
+        identities_map, response = await asyncio.gather(
+            self.substrate.query_map(
+                module="Registry",
+                storage_function="IdentityOf",
+                block_hash=block_hash,
+            ),
+            self._get_http_session().get(DELEGATES_DETAILS_URL),
+        )
 
+        try:
             all_delegates_details = {
                 decode_account_id(ss58_address[0]): DelegatesDetails.from_chain_data(
                     decode_hex_identity_dict(identity["info"])
                 )
-                for ss58_address, identity in identities_info
+                for ss58_address, identity in await identities_map.fetch_all()
             }
 
             if response.ok:
@@ -1247,6 +1848,9 @@ class AsyncSubtensor:
                         delegate_info.pgp_fingerprint
                         or delegate_details.get("fingerprint", "")
                     )
+        finally:
+            # Hand the connection back to the shared session's pool, even if reading the response failed.
+            response.release()
 
         return all_delegates_details
 
@@ -1278,13 +1882,16 @@ class AsyncSubtensor:
 
         The UID is a critical identifier within the network, linking the neuron's hotkey to its operational and governance activities on a particular subnet.
         """
-        result = await self.substrate.query(
-            module="SubtensorModule",
-            storage_function="Uids",
-            params=[netuid, hotkey_ss58],
-            block_hash=block_hash,
+        # A UID is a bare little-endian u16, so the raw storage value is unpacked without a SCALE decode.
+        storage_key = await self.substrate.create_storage_key(
+            "SubtensorModule", "Uids", [netuid, hotkey_ss58], block_hash=block_hash
         )
-        return result
+        response = await self.substrate.rpc_request(
+            "state_getStorage", [storage_key.to_hex()], block_hash=block_hash
+        )
+        if (raw_uid := response.get("result")) is None:
+            return None
+        return int.from_bytes(hex_to_bytes(raw_uid), "little")
 
     async def weights_rate_limit(self, netuid: int) -> Optional[int]:
         """
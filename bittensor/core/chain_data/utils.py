@@ -1,5 +1,6 @@
 """Chain data helper functions and data."""
 
+import functools
 from enum import Enum
 from typing import Optional, Union
 
@@ -54,40 +55,49 @@ def from_scale_encoding(
     return from_scale_encoding_using_type_string(input_, type_string)
 
 
+@functools.cache
+def _get_rpc_runtime_config() -> RuntimeConfiguration:
+    """Builds the runtime configuration used to decode chain data and runtime API results once, and reuses it."""
+    rpc_runtime_config = RuntimeConfiguration()
+    rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
+    rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
+    return rpc_runtime_config
+
+
 def from_scale_encoding_using_type_string(
-    input_: Union[list[int], bytes, ScaleBytes], type_string: str
+    input_: Union[list[int], bytes, bytearray, ScaleBytes], type_string: str
 ) -> Optional[dict]:
     """
     Decodes SCALE encoded data to a dictionary based on the provided type string.
 
     Args:
-        input_ (Union[List[int], bytes, ScaleBytes]): The SCALE encoded input data.
+        input_ (Union[List[int], bytes, bytearray, ScaleBytes]): The SCALE encoded input data.
         type_string (str): The type string defining the structure of the data.
 
     Returns:
         Optional[dict]: The decoded data as a dictionary, or ``None`` if the decoding fails.
 
     Raises:
-        TypeError: If the input_ is not a list[int], bytes, or ScaleBytes.
+        TypeError: If the input_ is not a list[int], bytes, bytearray, or ScaleBytes.
     """
     if isinstance(input_, ScaleBytes):
         as_scale_bytes = input_
     else:
-        if isinstance(input_, list) and all([isinstance(i, int) for i in input_]):
+        if isinstance(input_, list) and all(isinstance(i, int) for i in input_):
             vec_u8 = input_
             as_bytes = bytes(vec_u8)
-        elif isinstance(input_, bytes):
+        elif isinstance(input_, (bytes, bytearray)):
             as_bytes = input_
         else:
-            raise TypeError("input_ must be a list[int], bytes, or ScaleBytes")
+            raise TypeError(
+                "input_ must be a list[int], bytes, bytearray, or ScaleBytes"
+            )
 
         as_scale_bytes = ScaleBytes(as_bytes)
 
-    rpc_runtime_config = RuntimeConfiguration()
-    rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
-    rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
-
-    obj = rpc_runtime_config.create_scale_object(type_string, data=as_scale_bytes)
+    obj = _get_rpc_runtime_config().create_scale_object(
+        type_string, data=as_scale_bytes
+    )
 
     return obj.decode()
 
@@ -270,8 +280,8 @@ def decode_account_id(account_id_bytes: Union[bytes, str]) -> str:
     Returns:
         str: The decoded AccountId as a Base64 string.
     """
-    # Convert the AccountId bytes to a Base64 string
-    return ss58_encode(bytes(account_id_bytes).hex(), SS58_FORMAT)
+    # Convert the AccountId bytes to a Base64 string (ss58_encode takes raw bytes, no hex needed)
+    return ss58_encode(bytes(account_id_bytes), SS58_FORMAT)
 
 
 def process_stake_data(stake_data: list) -> dict:
@@ -41,6 +41,8 @@ if typing.TYPE_CHECKING:
     from bittensor.core.subtensor import Subtensor
 
 
+_LOCAL_NETWORK = settings.NETWORKS[3]
+
 METAGRAPH_STATE_DICT_NDARRAY_KEYS = [
     "version",
     "n",
@@ -559,7 +561,7 @@ class MetagraphMixin(ABC):
 
         if (
             subtensor.chain_endpoint != settings.ARCHIVE_ENTRYPOINT
-            or subtensor.network != settings.NETWORKS[3]
+            or subtensor.network != _LOCAL_NETWORK
         ):
             cur_block = subtensor.get_current_block()
             if block and block < (cur_block - 300):
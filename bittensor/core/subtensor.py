@@ -25,6 +25,7 @@ import copy
 import socket
 import ssl
 from typing import Union, Optional, TypedDict, Any
+from urllib.parse import urlparse
 
 import numpy as np
 import scalecodec
@@ -85,6 +86,14 @@ from bittensor.utils.weight_utils import generate_weight_hash
 
 KEY_NONCE: dict[str, int] = {}
 
+# Known chain hosts, mapped to their network name and canonical endpoint.
+_HOST_TO_NETWORK: dict[str, tuple[str, str]] = {
+    "entrypoint-finney.opentensor.ai": ("finney", settings.FINNEY_ENTRYPOINT),
+    "test.finney.opentensor.ai": ("test", settings.FINNEY_TEST_ENTRYPOINT),
+    "archive.chain.opentensor.ai": ("archive", settings.ARCHIVE_ENTRYPOINT),
+}
+_LOCAL_HOSTS = frozenset({"127.0.0.1", "localhost"})
+
 
 class ParamWithTypes(TypedDict):
     name: str  # Name of the parameter.
@@ -171,9 +180,8 @@ class Subtensor:
         # network.
         # Argument importance: network > chain_endpoint > config.subtensor.chain_endpoint > config.subtensor.network
 
-        if config is None:
-            config = Subtensor.config()
-        self._config = copy.deepcopy(config)
+        # A freshly built config is not shared with the caller, so only a passed-in config needs copying.
+        self._config = Subtensor.config() if config is None else copy.deepcopy(config)
 
         # Setup config.subtensor.network and config.subtensor.chain_endpoint
         self.chain_endpoint, self.network = Subtensor.setup_config(
@@ -279,51 +287,21 @@ class Subtensor:
         Returns:
             tuple: A tuple containing the formatted WebSocket endpoint URL and the evaluated network name.
         """
-        if network is not None:
-            (
-                evaluated_network,
-                evaluated_endpoint,
-            ) = Subtensor.determine_chain_endpoint_and_network(network)
-        else:
+        if network is None:
             if config.is_set("subtensor.chain_endpoint"):
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = Subtensor.determine_chain_endpoint_and_network(
-                    config.subtensor.chain_endpoint
-                )
-
+                network = config.subtensor.chain_endpoint
             elif config.is_set("subtensor.network"):
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = Subtensor.determine_chain_endpoint_and_network(
-                    config.subtensor.network
-                )
-
+                network = config.subtensor.network
             elif config.subtensor.get("chain_endpoint"):
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = Subtensor.determine_chain_endpoint_and_network(
-                    config.subtensor.chain_endpoint
-                )
-
+                network = config.subtensor.chain_endpoint
             elif config.subtensor.get("network"):
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = Subtensor.determine_chain_endpoint_and_network(
-                    config.subtensor.network
-                )
-
+                network = config.subtensor.network
             else:
-                (
-                    evaluated_network,
-                    evaluated_endpoint,
-                ) = Subtensor.determine_chain_endpoint_and_network(
-                    settings.DEFAULTS.subtensor.network
-                )
+                network = settings.DEFAULTS.subtensor.network
+
+        evaluated_network, evaluated_endpoint = (
+            Subtensor.determine_chain_endpoint_and_network(network)
+        )
 
         return (
             networking.get_formatted_ws_endpoint_url(evaluated_endpoint),
@@ -535,7 +513,7 @@ class Subtensor:
         rpc_runtime_config.update_type_registry(load_type_registry_preset("legacy"))
         rpc_runtime_config.update_type_registry(custom_rpc_type_registry)
         obj = rpc_runtime_config.create_scale_object(return_type, as_scale_bytes)
-        if obj.data.to_hex() == "0x0400":  # RPC returned None result
+        if obj.data.data == b"\x04\x00":  # RPC returned None result
             return None
 
         return obj.decode()
@@ -691,26 +669,17 @@ class Subtensor:
             return None, None
         if network in settings.NETWORKS:
             return network, settings.NETWORK_MAP[network]
-        else:
-            if (
-                network == settings.FINNEY_ENTRYPOINT
-                or "entrypoint-finney.opentensor.ai" in network
-            ):
-                return "finney", settings.FINNEY_ENTRYPOINT
-            elif (
-                network == settings.FINNEY_TEST_ENTRYPOINT
-                or "test.finney.opentensor.ai" in network
-            ):
-                return "test", settings.FINNEY_TEST_ENTRYPOINT
-            elif (
-                network == settings.ARCHIVE_ENTRYPOINT
-                or "archive.chain.opentensor.ai" in network
-            ):
-                return "archive", settings.ARCHIVE_ENTRYPOINT
-            elif "127.0.0.1" in network or "localhost" in network:
-                return "local", network
-            else:
-                return "unknown", network
+
+        try:
+            host = urlparse(network if "://" in network else f"//{network}").hostname
+        except ValueError:
+            host = None
+        host = host or network
+        if host in _HOST_TO_NETWORK:
+            return _HOST_TO_NETWORK[host]
+        if host in _LOCAL_HOSTS:
+            return "local", network
+        return "unknown", network
 
     def get_netuids_for_hotkey(
         self, hotkey_ss58: str, block: Optional[int] = None
@@ -1303,8 +1272,9 @@ class Subtensor:
         Returns:
             str: The commitment data as a string.
         """
-        metagraph = self.metagraph(netuid)
-        hotkey = metagraph.hotkeys[uid]  # type: ignore
+        # Only the neuron's hotkey is needed, so read it instead of syncing the metagraph.
+        _result = self.query_subtensor("Keys", block, [netuid, uid])
+        hotkey = getattr(_result, "value", None)
 
         metadata = get_metadata(self, netuid, hotkey, block)
         try:
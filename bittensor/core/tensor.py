@@ -188,7 +188,8 @@ class Tensor(BaseModel):
             # Reshape does not work for (0) or [0]
             if not (len(shape) == 1 and shape[0] == 0):
                 numpy_object = numpy_object.reshape(shape)
-            return numpy_object.astype(dtypes[self.dtype])
+            # The buffer was already copied above, so only cast when the dtype differs.
+            return numpy_object.astype(dtypes[self.dtype], copy=False)
 
     @staticmethod
     def serialize(tensor_: Union["np.ndarray", "torch.Tensor"]) -> "Tensor":
@@ -208,7 +209,8 @@ class Tensor(BaseModel):
         shape = list(tensor_.shape)
         if len(shape) == 0:
             shape = [0]
-        tensor__ = tensor_.cpu().detach().numpy().copy() if use_torch() else tensor_
+        # msgpack copies the array data into its own buffer, so no intermediate copy is needed.
+        tensor__ = tensor_.cpu().detach().numpy() if use_torch() else tensor_
         data_buffer = base64.b64encode(
             msgpack.packb(tensor__, default=msgpack_numpy.encode)
         ).decode("utf-8")
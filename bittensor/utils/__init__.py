@@ -17,6 +17,7 @@
 
 import ast
 from collections import namedtuple
+import functools
 import hashlib
 from typing import Any, Literal, Union, Optional, TYPE_CHECKING
 from urllib.parse import urlparse
@@ -44,10 +45,15 @@ U64_MAX = 18446744073709551615
 UnlockStatus = namedtuple("UnlockStatus", ["success", "message"])
 
 
+@functools.lru_cache(maxsize=4096)
+def _ss58_to_u8_tuple(ss58_address: str) -> tuple[int, ...]:
+    # The same handful of addresses is encoded over and over; decoding and checksumming is the costly part.
+    return tuple(ss58_address_to_bytes(ss58_address))
+
+
 def ss58_to_vec_u8(ss58_address: str) -> list[int]:
-    ss58_bytes: bytes = ss58_address_to_bytes(ss58_address)
-    encoded_address: list[int] = [int(byte) for byte in ss58_bytes]
-    return encoded_address
+    # A fresh list is returned so callers can't mutate the cached value.
+    return list(_ss58_to_u8_tuple(ss58_address))
 
 
 def strtobool(val: str) -> Union[bool, Literal["==SUPRESS=="]]:
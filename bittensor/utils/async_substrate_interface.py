@@ -1,6 +1,7 @@
 import asyncio
 import json
 import random
+import re
 from collections import defaultdict
 from dataclasses import dataclass
 from hashlib import blake2b
@@ -22,8 +23,31 @@ from substrateinterface.exceptions import (
 )
 from substrateinterface.storage import StorageKey
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ResultHandler = Callable[[dict, Any], Awaitable[tuple[dict, bool]]]
 
+# A run of 19+ digits may not fit in a 64-bit integer.
+_LONG_NUMBER = re.compile(r"\d{19,}")
+_LONG_NUMBER_BYTES = re.compile(rb"\d{19,}")
+
+
+def _json_loads(message: Union[str, bytes]) -> Any:
+    """
+    Parses a JSON-RPC message, with orjson when it is installed.
+
+    orjson parses integers wider than 64 bits as floats without raising, which would silently lose precision on u128
+    values such as balances. Messages that may hold such a number are parsed by the standard library instead.
+    """
+    if orjson is not None:
+        long_number = _LONG_NUMBER_BYTES if isinstance(message, bytes) else _LONG_NUMBER
+        if long_number.search(message) is None:
+            return orjson.loads(message)
+    return json.loads(message)
+
 
 class TimeoutException(Exception):
     pass
@@ -383,6 +407,25 @@ class QueryMapResult:
         self.last_key = result.last_key
         return result.records
 
+    async def fetch_all(self) -> list:
+        """
+        Loads every remaining page and returns all records not yet iterated over.
+
+        This gives the same records as ``async for``, but extends a list a page at a time instead of awaiting
+        ``__anext__`` once per record, which matters for maps with thousands of entries.
+
+        :return: list of the remaining records
+        """
+        # Drain what partial iteration left in the current page before paging on.
+        records = list(self._buffer)
+        while not self.loading_complete:
+            next_page = await self.retrieve_next_page(self.last_key)
+            if next_page:
+                records.extend(next_page)
+            else:
+                self.loading_complete = True
+        return records
+
     def __aiter__(self):
         return self
 
@@ -680,6 +723,11 @@ class Websocket:
 
     async def shutdown(self):
         async with self._lock:
+            if (
+                self._exit_task is not None
+                and self._exit_task is not asyncio.current_task()
+            ):
+                self._exit_task.cancel()
             try:
                 self._receiving_task.cancel()
                 await self._receiving_task
@@ -693,7 +741,7 @@ class Websocket:
 
     async def _recv(self) -> None:
         try:
-            response = json.loads(
+            response = _json_loads(
                 await cast(websockets.WebSocketClientProtocol, self.ws).recv()
             )
             async with self._lock:
@@ -794,6 +842,7 @@ class AsyncSubstrateInterface:
         self.runtime_version = None
         self.runtime_config = RuntimeConfigurationObject()
         self.__metadata_cache = {}
+        self.__constant_cache: dict[tuple[str, str, int], ScaleType] = {}
         self.type_registry_preset = None
         self.transaction_version = None
         self.metadata = None
@@ -832,7 +881,7 @@ class AsyncSubstrateInterface:
         storage_item = metadata_pallet.get_storage_function(storage_function)
         return storage_item
 
-    async def _get_current_block_hash(
+    def _get_current_block_hash(
         self, block_hash: Optional[str], reuse: bool
     ) -> Optional[str]:
         if block_hash:
@@ -1133,6 +1182,40 @@ class AsyncSubstrateInterface:
             metadata=self.metadata,
         )
 
+    async def create_storage_keys(
+        self,
+        pallet: str,
+        storage_function: str,
+        params_list: list[list],
+        block_hash: str = None,
+    ) -> list[StorageKey]:
+        """
+        Create a `StorageKey` instance for each entry of `params_list`. Unlike calling `create_storage_key` once per
+        entry, the runtime is only initialised once, so no RPC is made per key.
+
+        Parameters
+        ----------
+        pallet: name of pallet
+        storage_function: name of storage function
+        params_list: list of parameter lists, one per storage key
+
+        Returns
+        -------
+        list of StorageKey, in the same order as `params_list`
+        """
+        await self.init_runtime(block_hash=block_hash)
+
+        return [
+            StorageKey.create_from_storage_function(
+                pallet,
+                storage_function,
+                params,
+                runtime_config=self.runtime_config,
+                metadata=self.metadata,
+            )
+            for params in params_list
+        ]
+
     async def _get_block_handler(
         self,
         block_hash: str,
@@ -1283,12 +1366,22 @@ class AsyncSubstrateInterface:
         if callable(subscription_handler):
             rpc_method_prefix = "Finalized" if finalized_only else "New"
 
-            async def result_handler(message, update_nr, subscription_id):
+            update_nr = 0
+
+            async def result_handler(
+                message: dict, subscription_id
+            ) -> tuple[Any, bool]:
+                nonlocal update_nr
+                if "params" not in message:
+                    # The first message only confirms the subscription and carries its id
+                    return None, False
+
                 new_block = await decode_block({"header": message["params"]["result"]})
 
                 subscription_result = subscription_handler(
                     new_block, update_nr, subscription_id
                 )
+                update_nr += 1
 
                 if subscription_result is not None:
                     # Handler returned end result: unsubscribe from further updates
@@ -1298,8 +1391,9 @@ class AsyncSubstrateInterface:
                             [subscription_id],
                         )
                     )
+                    return subscription_result, True
 
-                return subscription_result
+                return None, False
 
             result = await self._make_rpc_request(
                 [
@@ -1312,7 +1406,7 @@ class AsyncSubstrateInterface:
                 result_handler=result_handler,
             )
 
-            return result
+            return result["_get_block_handler"][-1]
 
         else:
             if header_only:
@@ -1381,6 +1475,37 @@ class AsyncSubstrateInterface:
             include_author=include_author,
         )
 
+    async def subscribe_block_headers(
+        self,
+        subscription_handler: Callable,
+        ignore_decoding_errors: bool = False,
+        include_author: bool = False,
+        finalized_only: bool = False,
+    ):
+        """
+        Subscribes to new block headers and calls `subscription_handler` for every header the node pushes. The
+        subscription ends when `subscription_handler` returns anything other than None.
+
+        Parameters
+        ----------
+        subscription_handler: callable taking (block, update_nr, subscription_id)
+        ignore_decoding_errors: When set this will catch all decoding errors, set the item to None and continue decoding
+        include_author: This will retrieve the block author from the validator set and add to the result
+        finalized_only: when set, only finalized headers are pushed
+
+        Returns
+        -------
+        The value returned by `subscription_handler` that ended the subscription
+        """
+        return await self._get_block_handler(
+            block_hash=None,
+            ignore_decoding_errors=ignore_decoding_errors,
+            include_author=include_author,
+            header_only=True,
+            finalized_only=finalized_only,
+            subscription_handler=subscription_handler,
+        )
+
     async def get_events(self, block_hash: Optional[str] = None) -> list:
         """
         Convenience method to get events for a certain block (storage call for module 'System' and function 'Events')
@@ -1689,7 +1814,7 @@ class AsyncSubstrateInterface:
 
         :return: the response from the RPC request
         """
-        block_hash = await self._get_current_block_hash(block_hash, reuse_block_hash)
+        block_hash = self._get_current_block_hash(block_hash, reuse_block_hash)
         params = params or []
         payload_id = f"{method}{random.randint(0, 7000)}"
         payloads = [
@@ -1713,6 +1838,50 @@ class AsyncSubstrateInterface:
         else:
             raise SubstrateRequestException(result[payload_id][0])
 
+    async def rpc_batch_request(
+        self,
+        requests: list[tuple[str, Optional[list]]],
+        block_hash: Optional[str] = None,
+        reuse_block_hash: bool = False,
+    ) -> list[Any]:
+        """
+        Makes several RPC requests at once. Each request is sent as its own websocket frame, but all of them are
+        written back-to-back before any response is awaited, so their round trips overlap instead of running one
+        after another. This pipelines the requests; it does not send a JSON-RPC batch array.
+
+        :param requests: list of `(method, params)` tuples
+        :param block_hash: optional str, the hash of the block appended to every request's params
+        :param reuse_block_hash: optional bool, whether to append the last-used block hash to every request's params
+
+        :return: the responses, in the same order as `requests`
+        """
+        block_hash = self._get_current_block_hash(block_hash, reuse_block_hash)
+        payloads = [
+            self.make_payload(
+                f"{method}{idx}",
+                method,
+                (params or []) + [block_hash] if block_hash else (params or []),
+            )
+            for idx, (method, params) in enumerate(requests)
+        ]
+        runtime = Runtime(
+            self.chain,
+            self.runtime_config,
+            self.metadata,
+            self.type_registry,
+        )
+        result = await self._make_rpc_request(payloads, runtime=runtime)
+
+        responses = []
+        for payload in payloads:
+            response = result[payload["id"]][0]
+            if "error" in response:
+                raise SubstrateRequestException(response["error"]["message"])
+            if "result" not in response:
+                raise SubstrateRequestException(response)
+            responses.append(response)
+        return responses
+
     async def get_block_hash(self, block_id: int) -> str:
         return (await self.rpc_request("chain_getBlockHash", [block_id]))["result"]
 
@@ -1786,7 +1955,7 @@ class AsyncSubstrateInterface:
         # By allowing for specifying the block hash, users, if they have multiple query types they want
         # to do, can simply query the block hash first, and then pass multiple query_subtensor calls
         # into an asyncio.gather, with the specified block hash
-        block_hash = await self._get_current_block_hash(block_hash, reuse_block_hash)
+        block_hash = self._get_current_block_hash(block_hash, reuse_block_hash)
         if block_hash:
             self.last_block_hash = block_hash
         runtime = await self.init_runtime(block_hash=block_hash)
@@ -2300,17 +2469,23 @@ class AsyncSubstrateInterface:
 
         :return: ScaleType from the runtime call
         """
-        block_hash = await self._get_current_block_hash(block_hash, reuse_block_hash)
+        block_hash = self._get_current_block_hash(block_hash, reuse_block_hash)
+        # Constants only change with a runtime upgrade, so decode each one once per runtime version
+        cache_key = (module_name, constant_name, self.runtime_version)
+        if cache_key in self.__constant_cache:
+            return self.__constant_cache[cache_key]
         constant = await self.get_metadata_constant(
             module_name, constant_name, block_hash=block_hash
         )
         if constant:
             # Decode to ScaleType
-            return await self.decode_scale(
+            value = await self.decode_scale(
                 constant.type,
                 bytes(constant.constant_value),
                 return_scale_obj=True,
             )
+            self.__constant_cache[cache_key] = value
+            return value
         else:
             return None
 
@@ -2370,7 +2545,7 @@ class AsyncSubstrateInterface:
         Queries subtensor. This should only be used when making a single request. For multiple requests,
         you should use ``self.query_multiple``
         """
-        block_hash = await self._get_current_block_hash(block_hash, reuse_block_hash)
+        block_hash = self._get_current_block_hash(block_hash, reuse_block_hash)
         if block_hash:
             self.last_block_hash = block_hash
         runtime = await self.init_runtime(block_hash=block_hash)
@@ -2438,7 +2613,7 @@ class AsyncSubstrateInterface:
         :return: QueryMapResult object
         """
         params = params or []
-        block_hash = await self._get_current_block_hash(block_hash, reuse_block_hash)
+        block_hash = self._get_current_block_hash(block_hash, reuse_block_hash)
         if block_hash:
             self.last_block_hash = block_hash
         runtime = await self.init_runtime(block_hash=block_hash)
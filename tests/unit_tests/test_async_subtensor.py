@@ -1,7 +1,10 @@
+from types import SimpleNamespace
+
 import pytest
 
 from bittensor import AsyncSubtensor
 from bittensor.core import async_subtensor
+from bittensor.core.chain_data import utils as chain_data_utils
 
 
 @pytest.fixture(autouse=True)
@@ -70,6 +73,13 @@ def test_decode_hex_identity_dict_with_nested_dict():
     assert result["identity"] == "41 4243"
 
 
+def test_decode_hex_identity_dict_with_multi_byte_tuple():
+    """Tests _decode_hex_identity_dict hex-encodes a value that is a tuple of several ints."""
+    info_dict = {"pgp_fingerprint": (0, 1, 2, 171, 205)}
+    result = async_subtensor._decode_hex_identity_dict(info_dict)
+    assert result["pgp_fingerprint"] == "00 0102 ABCD"
+
+
 @pytest.mark.asyncio
 async def test_init_if_unknown_network_is_valid(mocker):
     """Tests __init__ if passed network unknown and is valid."""
@@ -146,6 +156,8 @@ async def test_async_subtensor_magic_methods(mocker):
     fake_async_substrate.__aenter__.assert_called_once()
     fake_async_substrate.__aexit__.assert_called_once()
     fake_async_substrate.close.assert_awaited_once()
+    fake_async_substrate.ws.__aenter__.assert_awaited_once()
+    fake_async_substrate.ws.__aexit__.assert_awaited_once()
 
 
 @pytest.mark.parametrize(
@@ -184,11 +196,10 @@ async def test_async_subtensor_aenter_connection_refused_error(
 async def test_encode_params(subtensor, mocker):
     """Tests encode_params happy path."""
     # Preps
-    subtensor.substrate.create_scale_object = mocker.AsyncMock(
-        autospec=async_subtensor.AsyncSubstrateInterface.create_scale_object
-    )
-    subtensor.substrate.create_scale_object.return_value.encode = mocker.Mock(
-        return_value=b""
+    fake_runtime = subtensor.substrate.init_runtime.return_value
+    fake_runtime.runtime_config = mocker.Mock()
+    fake_runtime.runtime_config.create_scale_object.return_value.encode = mocker.Mock(
+        return_value=mocker.Mock(data=bytearray(b"\x01"))
     )
 
     call_definition = {
@@ -203,25 +214,34 @@ async def test_encode_params(subtensor, mocker):
     decoded_params = await subtensor.encode_params(
         call_definition=call_definition, params=params
     )
+    await subtensor.encode_params(call_definition=call_definition, params=params)
 
     # Asserts
-    subtensor.substrate.create_scale_object.call_args(
-        mocker.call("coldkey"),
-        mocker.call("Vec<u8>"),
-        mocker.call("uid"),
-        mocker.call("u16"),
-    )
-    assert decoded_params == "0x"
+    assert fake_runtime.runtime_config.create_scale_object.call_args_list == [
+        mocker.call("Vec<u8>", metadata=fake_runtime.metadata),
+        mocker.call("u16", metadata=fake_runtime.metadata),
+    ]
+    assert decoded_params == "0x0101"
+
+
+@pytest.mark.asyncio
+async def test_encode_params_without_params(subtensor):
+    """Tests encode_params returns empty data without initializing the runtime when there are no params."""
+    # Call
+    result = await subtensor.encode_params(call_definition={"params": []}, params=[])
+
+    # Asserts
+    subtensor.substrate.init_runtime.assert_not_called()
+    assert result == "0x"
 
 
 @pytest.mark.asyncio
 async def test_encode_params_raises_error(subtensor, mocker):
     """Tests encode_params with raised error."""
     # Preps
-    subtensor.substrate.create_scale_object = mocker.AsyncMock(
-        autospec=async_subtensor.AsyncSubstrateInterface.create_scale_object
-    )
-    subtensor.substrate.create_scale_object.return_value.encode = mocker.Mock(
+    fake_runtime = subtensor.substrate.init_runtime.return_value
+    fake_runtime.runtime_config = mocker.Mock()
+    fake_runtime.runtime_config.create_scale_object.return_value.encode = mocker.Mock(
         return_value=b""
     )
 
@@ -236,7 +256,7 @@ async def test_encode_params_raises_error(subtensor, mocker):
     with pytest.raises(ValueError):
         await subtensor.encode_params(call_definition=call_definition, params=params)
 
-        subtensor.substrate.create_scale_object.return_value.encode.assert_not_called()
+        fake_runtime.runtime_config.create_scale_object.return_value.encode.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -250,6 +270,118 @@ async def test_get_current_block(subtensor):
     assert result == subtensor.substrate.get_block_number.return_value
 
 
+@pytest.mark.asyncio
+async def test_get_current_block_concurrent_calls_are_coalesced(subtensor, mocker):
+    """Tests concurrent get_current_block calls share one request but later calls refetch."""
+    # Preps
+    mocked_get_block_number = mocker.AsyncMock(return_value=100)
+    subtensor.substrate.get_block_number = mocked_get_block_number
+
+    # Call
+    results = await async_subtensor.asyncio.gather(
+        subtensor.get_current_block(), subtensor.get_current_block()
+    )
+    await subtensor.get_current_block()
+
+    # Asserts
+    assert results == [100, 100]
+    assert mocked_get_block_number.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_current_block_uses_pushed_chain_head(subtensor, mocker):
+    """Tests get_current_block serves the head pushed by the header subscription."""
+    # Preps
+    mocked_get_block_number = mocker.AsyncMock(return_value=100)
+    subtensor.substrate.get_block_number = mocked_get_block_number
+
+    async def fake_subscribe_block_headers(handler):
+        handler({"header": {"number": 101}}, 0, "subscription_id")
+
+    subtensor.substrate.subscribe_block_headers = mocker.AsyncMock(
+        side_effect=fake_subscribe_block_headers
+    )
+
+    # Call
+    first = await subtensor.get_current_block()
+    subtensor.watch_chain_head()
+    await subtensor._head_watcher
+    second = await subtensor.get_current_block()
+
+    # Asserts
+    subtensor.substrate.subscribe_block_headers.assert_called_once()
+    mocked_get_block_number.assert_awaited_once()
+    assert (first, second) == (100, 101)
+
+
+@pytest.mark.asyncio
+async def test_get_current_block_does_not_start_chain_head_watcher(subtensor):
+    """Tests a plain get_current_block call does not start a header subscription."""
+    # Call
+    await subtensor.get_current_block()
+
+    # Asserts
+    subtensor.substrate.subscribe_block_headers.assert_not_called()
+    assert subtensor._head_watcher is None
+
+
+@pytest.mark.asyncio
+async def test_stop_watching_chain_head_cancels_subscription(subtensor, mocker):
+    """Tests stopping the chain head watcher cancels and awaits the subscription."""
+    # Preps
+    subscribed = async_subtensor.asyncio.Event()
+
+    async def fake_subscribe_block_headers(handler):
+        subscribed.set()
+        await async_subtensor.asyncio.Event().wait()
+
+    subtensor.substrate.subscribe_block_headers = mocker.AsyncMock(
+        side_effect=fake_subscribe_block_headers
+    )
+    subtensor.watch_chain_head()
+    watcher = subtensor._head_watcher
+    await subscribed.wait()
+
+    # Call
+    await subtensor.stop_watching_chain_head()
+
+    # Asserts
+    assert watcher.cancelled()
+    assert subtensor._head_watcher is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_query(subtensor, mocker):
+    """Tests bulk_query pins every request to one chain head lookup."""
+    # Preps
+    fake_block_hash = "block_hash"
+    subtensor.substrate.get_chain_head = mocker.AsyncMock(return_value=fake_block_hash)
+    mocked_get_total_subnets = mocker.AsyncMock(return_value=10)
+    subtensor.get_total_subnets = mocked_get_total_subnets
+    mocked_get_subnet_burn_cost = mocker.AsyncMock(return_value="100")
+    subtensor.get_subnet_burn_cost = mocked_get_subnet_burn_cost
+    mocked_get_subnet_hyperparameters = mocker.AsyncMock()
+    subtensor.get_subnet_hyperparameters = mocked_get_subnet_hyperparameters
+
+    # Call
+    result = await subtensor.bulk_query(
+        [
+            ("get_total_subnets", {}),
+            ("get_subnet_burn_cost", {}),
+            ("get_subnet_hyperparameters", {"netuid": 1}),
+        ]
+    )
+
+    # Asserts
+    subtensor.substrate.get_chain_head.assert_awaited_once()
+    mocked_get_total_subnets.assert_awaited_once_with(block_hash=fake_block_hash)
+    mocked_get_subnet_burn_cost.assert_awaited_once_with(block_hash=fake_block_hash)
+    mocked_get_subnet_hyperparameters.assert_awaited_once_with(
+        netuid=1, block_hash=fake_block_hash
+    )
+    assert result == [10, "100", mocked_get_subnet_hyperparameters.return_value]
+
+
 @pytest.mark.asyncio
 async def test_get_block_hash_without_block_id_aka_none(subtensor):
     """Tests get_block_hash method without passed block_id."""
@@ -260,6 +392,27 @@ async def test_get_block_hash_without_block_id_aka_none(subtensor):
     assert result == subtensor.substrate.get_chain_head.return_value
 
 
+@pytest.mark.asyncio
+async def test_get_block_hash_reuses_recent_chain_head(subtensor, mocker):
+    """Tests get_block_hash without block_id reuses a head looked up moments ago."""
+    # Preps
+    mocked_get_chain_head = mocker.AsyncMock(side_effect=["head_1", "head_2"])
+    subtensor.substrate.get_chain_head = mocked_get_chain_head
+
+    # Call
+    results = [await subtensor.get_block_hash(), await subtensor.get_block_hash()]
+    # Age the remembered head past its TTL
+    subtensor._chain_head = (
+        async_subtensor.time.monotonic() - async_subtensor.CHAIN_HEAD_TTL,
+        "head_1",
+    )
+    results.append(await subtensor.get_block_hash())
+
+    # Asserts
+    assert results == ["head_1", "head_1", "head_2"]
+    assert mocked_get_chain_head.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_block_hash_with_block_id(subtensor):
     """Tests get_block_hash method with passed block_id."""
@@ -271,13 +424,43 @@ async def test_get_block_hash_with_block_id(subtensor):
 
 
 @pytest.mark.asyncio
-async def test_is_hotkey_registered_any(subtensor, mocker):
-    """Tests is_hotkey_registered_any method."""
+async def test_get_block_hash_caches_only_final_blocks(subtensor, mocker):
+    """Tests get_block_hash remembers hashes of blocks far behind the head but refetches recent ones."""
     # Preps
-    mocked_get_netuids_for_hotkey = mocker.AsyncMock(
-        return_value=[1, 2], autospec=subtensor.get_netuids_for_hotkey
+    subtensor.substrate.get_block_number = mocker.AsyncMock(return_value=1000)
+    mocked_get_block_hash = mocker.AsyncMock(
+        side_effect=lambda block_id: f"0x{block_id}"
     )
-    subtensor.get_netuids_for_hotkey = mocked_get_netuids_for_hotkey
+    subtensor.substrate.get_block_hash = mocked_get_block_hash
+    await subtensor.get_current_block()
+
+    # Call
+    old_hashes = [await subtensor.get_block_hash(10) for _ in range(2)]
+    recent_hashes = [await subtensor.get_block_hash(999) for _ in range(2)]
+
+    # Asserts
+    assert old_hashes == ["0x10", "0x10"]
+    assert recent_hashes == ["0x999", "0x999"]
+    assert mocked_get_block_hash.await_args_list == [
+        mocker.call(10),
+        mocker.call(999),
+        mocker.call(999),
+    ]
+
+
+@pytest.mark.parametrize(
+    "records, response",
+    [([(0, False), (1, True), (2, True)], True), ([(0, False)], False), ([], False)],
+    ids=["registered", "only-stale-membership", "not-registered"],
+)
+@pytest.mark.asyncio
+async def test_is_hotkey_registered_any(subtensor, mocker, records, response):
+    """Tests is_hotkey_registered_any method."""
+    # Preps
+    fake_result = mocker.AsyncMock(autospec=list)
+    fake_result.__aiter__.return_value = iter(records)
+    mocked_substrate_query_map = mocker.AsyncMock(return_value=fake_result)
+    subtensor.substrate.query_map = mocked_substrate_query_map
 
     # Call
     result = await subtensor.is_hotkey_registered_any(
@@ -285,7 +468,13 @@ async def test_is_hotkey_registered_any(subtensor, mocker):
     )
 
     # Asserts
-    assert result is (len(mocked_get_netuids_for_hotkey.return_value) > 0)
+    mocked_substrate_query_map.assert_called_once_with(
+        module="SubtensorModule",
+        storage_function="IsNetworkMember",
+        params=["hotkey"],
+        block_hash="FAKE_HASH",
+    )
+    assert result is response
 
 
 @pytest.mark.asyncio
@@ -343,7 +532,7 @@ async def test_get_subnets(subtensor, mocker, records, response):
     # Preps
     fake_result = mocker.AsyncMock(autospec=list)
     fake_result.records = records
-    fake_result.__aiter__.return_value = iter(records)
+    fake_result.fetch_all.return_value = records
 
     mocked_substrate_query_map = mocker.AsyncMock(
         autospec=async_subtensor.AsyncSubstrateInterface.query_map,
@@ -390,7 +579,30 @@ async def test_is_hotkey_delegate(subtensor, mocker, hotkey_ss58_in_result):
 
     # Asserts
     assert result == hotkey_ss58_in_result
-    mocked_get_delegates.assert_called_once_with(block_hash=None, reuse_block=True)
+    mocked_get_delegates.assert_called_once_with(
+        block_hash=subtensor.substrate.last_block_hash
+    )
+
+
+@pytest.mark.asyncio
+async def test_is_hotkey_delegate_caches_hotkeys_per_block_hash(subtensor, mocker):
+    """Tests is_hotkey_delegate decodes the delegates once per block hash."""
+    # Preps
+    fake_block_hash = "block_hash"
+    mocked_get_delegates = mocker.AsyncMock(
+        return_value=[mocker.Mock(hotkey_ss58="hotkey_1")]
+    )
+    subtensor.get_delegates = mocked_get_delegates
+
+    # Call
+    results = [
+        await subtensor.is_hotkey_delegate(hotkey, block_hash=fake_block_hash)
+        for hotkey in ("hotkey_1", "hotkey_2")
+    ]
+
+    # Asserts
+    assert results == [True, False]
+    mocked_get_delegates.assert_awaited_once_with(block_hash=fake_block_hash)
 
 
 @pytest.mark.parametrize(
@@ -425,8 +637,7 @@ async def test_get_delegates(subtensor, mocker, fake_hex_bytes_result, response)
         runtime_api="DelegateInfoRuntimeApi",
         method="get_delegates",
         params=[],
-        block_hash=None,
-        reuse_block=True,
+        block_hash=subtensor.substrate.last_block_hash,
     )
 
 
@@ -521,16 +732,17 @@ async def test_query_runtime_api(subtensor, mocker):
     )
     subtensor.substrate.rpc_request = mocked_rpc_request
 
-    mocked_scalecodec = mocker.Mock(autospec=async_subtensor.scalecodec.ScaleBytes)
-    async_subtensor.scalecodec.ScaleBytes = mocked_scalecodec
+    mocked_scalecodec = mocker.patch.object(async_subtensor.scalecodec, "ScaleBytes")
 
-    mocked_runtime_configuration = mocker.Mock(
-        autospec=async_subtensor.RuntimeConfiguration
+    mocked_runtime_configuration = mocker.patch.object(
+        chain_data_utils, "RuntimeConfiguration"
     )
-    async_subtensor.RuntimeConfiguration = mocked_runtime_configuration
-
-    mocked_load_type_registry_preset = mocker.Mock()
-    async_subtensor.load_type_registry_preset = mocked_load_type_registry_preset
+    fake_scale_obj = (
+        mocked_runtime_configuration.return_value.create_scale_object.return_value
+    )
+    fake_scale_obj.data.data = b"\x08\x01\x02"
+    mocker.patch.object(chain_data_utils, "load_type_registry_preset")
+    async_subtensor._get_rpc_runtime_config.cache_clear()
 
     # Call
     result = await subtensor.query_runtime_api(
@@ -568,6 +780,213 @@ async def test_query_runtime_api(subtensor, mocker):
         result
         == mocked_runtime_configuration.return_value.create_scale_object.return_value.decode.return_value
     )
+    async_subtensor._get_rpc_runtime_config.cache_clear()
+
+
+def test_get_rpc_runtime_config_is_built_once(mocker):
+    """Tests the runtime API decoding configuration is only built on first use."""
+    # Preps
+    mocked_runtime_configuration = mocker.patch.object(
+        chain_data_utils, "RuntimeConfiguration"
+    )
+    mocker.patch.object(chain_data_utils, "load_type_registry_preset")
+    async_subtensor._get_rpc_runtime_config.cache_clear()
+
+    # Call
+    first = async_subtensor._get_rpc_runtime_config()
+    second = async_subtensor._get_rpc_runtime_config()
+
+    # Asserts
+    assert first is second is mocked_runtime_configuration.return_value
+    mocked_runtime_configuration.assert_called_once()
+    async_subtensor._get_rpc_runtime_config.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_decode_runtime_api_result_small_payload_inline(mocker):
+    """Tests small runtime API responses are decoded on the event loop."""
+    # Preps
+    mocker.patch.object(async_subtensor.scalecodec, "ScaleBytes")
+    mocked_get_rpc_runtime_config = mocker.patch.object(
+        async_subtensor, "_get_rpc_runtime_config"
+    )
+    fake_obj = (
+        mocked_get_rpc_runtime_config.return_value.create_scale_object.return_value
+    )
+    fake_obj.data.data = b"\x01" * async_subtensor.DECODE_IN_THREAD_THRESHOLD
+    mocked_to_thread = mocker.patch.object(async_subtensor.asyncio, "to_thread")
+
+    # Call
+    result = await async_subtensor.AsyncSubtensor._decode_runtime_api_result(
+        {"type": "Vec<u8>"}, {"result": "0x01"}
+    )
+
+    # Asserts
+    mocked_to_thread.assert_not_called()
+    fake_obj.decode.assert_called_once_with()
+    assert result == fake_obj.decode.return_value
+
+
+@pytest.mark.asyncio
+async def test_decode_runtime_api_result_large_payload_in_thread(mocker):
+    """Tests large runtime API responses are decoded in a worker thread."""
+    # Preps
+    mocker.patch.object(async_subtensor.scalecodec, "ScaleBytes")
+    mocked_get_rpc_runtime_config = mocker.patch.object(
+        async_subtensor, "_get_rpc_runtime_config"
+    )
+    fake_obj = (
+        mocked_get_rpc_runtime_config.return_value.create_scale_object.return_value
+    )
+    fake_obj.data.data = b"\x01" * (async_subtensor.DECODE_IN_THREAD_THRESHOLD + 1)
+    mocked_to_thread = mocker.patch.object(
+        async_subtensor.asyncio, "to_thread", new=mocker.AsyncMock()
+    )
+
+    # Call
+    result = await async_subtensor.AsyncSubtensor._decode_runtime_api_result(
+        {"type": "Vec<u8>"}, {"result": "0x01"}
+    )
+
+    # Asserts
+    mocked_to_thread.assert_awaited_once_with(fake_obj.decode)
+    assert result == mocked_to_thread.return_value
+
+
+@pytest.mark.parametrize(
+    "fake_result, expected",
+    [
+        ("0x10aabbccdd", b"\xaa\xbb\xcc\xdd"),
+        ("0x0101" + "ab" * 64, b"\xab" * 64),
+        ("0x0400", None),
+    ],
+    ids=["single byte prefix", "two byte prefix", "none"],
+)
+@pytest.mark.asyncio
+async def test_decode_runtime_api_result_raw(mocker, fake_result, expected):
+    """Tests raw runtime API results are returned as bytes without SCALE decoding."""
+    # Preps
+    mocked_get_rpc_runtime_config = mocker.patch.object(
+        async_subtensor, "_get_rpc_runtime_config"
+    )
+
+    # Call
+    result = await async_subtensor.AsyncSubtensor._decode_runtime_api_result(
+        {"type": "Vec<u8>"}, {"result": fake_result}, raw=True
+    )
+
+    # Asserts
+    mocked_get_rpc_runtime_config.assert_not_called()
+    assert result == expected
+
+
+@pytest.mark.asyncio
+async def test_decode_vec_u8_small_payload_inline(mocker):
+    """Tests small payloads are decoded on the event loop."""
+    # Preps
+    mocked_decode = mocker.Mock()
+    mocked_to_thread = mocker.patch.object(async_subtensor.asyncio, "to_thread")
+
+    # Call
+    result = await async_subtensor._decode_vec_u8(mocked_decode, b"\x01")
+
+    # Asserts
+    mocked_decode.assert_called_once_with(b"\x01")
+    mocked_to_thread.assert_not_called()
+    assert result == mocked_decode.return_value
+
+
+@pytest.mark.asyncio
+async def test_decode_vec_u8_large_payload_in_thread(mocker):
+    """Tests large payloads are decoded in a worker thread."""
+    # Preps
+    fake_vec_u8 = b"\x01" * (async_subtensor.DECODE_IN_THREAD_THRESHOLD + 1)
+    mocked_decode = mocker.Mock()
+    mocked_to_thread = mocker.patch.object(
+        async_subtensor.asyncio, "to_thread", new=mocker.AsyncMock()
+    )
+
+    # Call
+    result = await async_subtensor._decode_vec_u8(mocked_decode, fake_vec_u8)
+
+    # Asserts
+    mocked_to_thread.assert_awaited_once_with(mocked_decode, fake_vec_u8)
+    mocked_decode.assert_not_called()
+    assert result == mocked_to_thread.return_value
+
+
+@pytest.mark.asyncio
+async def test_query_runtime_api_batch(subtensor, mocker):
+    """Tests query_runtime_api_batch sends every call in one pipelined batch request."""
+    # Preps
+    fake_block_hash = "block_hash"
+    mocked_encode_params = mocker.AsyncMock(return_value="0x01")
+    subtensor.encode_params = mocked_encode_params
+
+    mocked_rpc_batch_request = mocker.AsyncMock(
+        return_value=[{"result": "0x00"}, {"result": "0x01"}]
+    )
+    subtensor.substrate.rpc_batch_request = mocked_rpc_batch_request
+
+    mocked_decode = mocker.patch.object(
+        async_subtensor.AsyncSubtensor,
+        "_decode_runtime_api_result",
+        new=mocker.AsyncMock(
+            side_effect=lambda call_definition, json_result: json_result["result"]
+        ),
+    )
+
+    # Call
+    result = await subtensor.query_runtime_api_batch(
+        [
+            ("DelegateInfoRuntimeApi", "get_delegates", None),
+            ("StakeInfoRuntimeApi", "get_stake_info_for_coldkey", [[1, 2]]),
+        ],
+        block_hash=fake_block_hash,
+    )
+
+    # Asserts
+    mocked_encode_params.assert_awaited_once()
+    mocked_rpc_batch_request.assert_awaited_once_with(
+        [
+            ("state_call", ["DelegateInfoRuntimeApi_get_delegates", "0x"]),
+            ("state_call", ["StakeInfoRuntimeApi_get_stake_info_for_coldkey", "0x01"]),
+        ],
+        block_hash=fake_block_hash,
+    )
+    assert mocked_decode.call_count == 2
+    assert result == ["0x00", "0x01"]
+
+
+@pytest.mark.asyncio
+async def test_query_runtime_api_batch_pins_chain_head(subtensor, mocker):
+    """Tests query_runtime_api_batch resolves the chain head once and runs every call at it."""
+    # Preps
+    mocked_get_block_hash = mocker.AsyncMock(return_value="head_hash")
+    subtensor.get_block_hash = mocked_get_block_hash
+    mocked_rpc_batch_request = mocker.AsyncMock(
+        return_value=[{"result": "0x00"}, {"result": "0x01"}]
+    )
+    subtensor.substrate.rpc_batch_request = mocked_rpc_batch_request
+    mocker.patch.object(
+        async_subtensor.AsyncSubtensor,
+        "_decode_runtime_api_result",
+        new=mocker.AsyncMock(
+            side_effect=lambda call_definition, json_result: json_result["result"]
+        ),
+    )
+
+    # Call
+    await subtensor.query_runtime_api_batch(
+        [
+            ("DelegateInfoRuntimeApi", "get_delegates", None),
+            ("DelegateInfoRuntimeApi", "get_delegates", None),
+        ]
+    )
+
+    # Asserts
+    mocked_get_block_hash.assert_awaited_once_with()
+    assert mocked_rpc_batch_request.await_args.kwargs["block_hash"] == "head_hash"
 
 
 @pytest.mark.asyncio
@@ -577,8 +996,8 @@ async def test_get_balance(subtensor, mocker):
     fake_addresses = ("a1", "a2")
     fake_block_hash = None
 
-    mocked_substrate_create_storage_key = mocker.AsyncMock()
-    subtensor.substrate.create_storage_key = mocked_substrate_create_storage_key
+    mocked_substrate_create_storage_keys = mocker.AsyncMock()
+    subtensor.substrate.create_storage_keys = mocked_substrate_create_storage_keys
 
     mocked_batch_0_call = mocker.Mock(
         params=[
@@ -597,11 +1016,43 @@ async def test_get_balance(subtensor, mocker):
     # Call
     result = await subtensor.get_balance(*fake_addresses, block_hash=fake_block_hash)
 
-    assert mocked_substrate_create_storage_key.call_count == len(fake_addresses)
-    mocked_substrate_query_multi.assert_called_once()
+    mocked_substrate_create_storage_keys.assert_awaited_once_with(
+        "System",
+        "Account",
+        [[address] for address in fake_addresses],
+        block_hash=fake_block_hash,
+    )
+    mocked_substrate_query_multi.assert_called_once_with(
+        mocked_substrate_create_storage_keys.return_value, block_hash=fake_block_hash
+    )
     assert result == {0: async_subtensor.Balance(1000)}
 
 
+@pytest.mark.asyncio
+async def test_get_balance_single_address(subtensor, mocker):
+    """Tests get_balance method with one address skips the storage-key batch."""
+    # Preps
+    fake_address = "a1"
+    fake_block_hash = "block_hash"
+
+    mocked_substrate_query = mocker.AsyncMock(return_value={"data": {"free": 1000}})
+    subtensor.substrate.query = mocked_substrate_query
+    subtensor.substrate.query_multi = mocker.AsyncMock()
+
+    # Call
+    result = await subtensor.get_balance(fake_address, block_hash=fake_block_hash)
+
+    # Asserts
+    mocked_substrate_query.assert_called_once_with(
+        module="System",
+        storage_function="Account",
+        params=[fake_address],
+        block_hash=fake_block_hash,
+    )
+    subtensor.substrate.query_multi.assert_not_called()
+    assert result == {fake_address: async_subtensor.Balance(1000)}
+
+
 @pytest.mark.parametrize("balance", [100, 100.1])
 @pytest.mark.asyncio
 async def test_get_transfer_fee(subtensor, mocker, balance):
@@ -640,6 +1091,33 @@ async def test_get_transfer_fee(subtensor, mocker, balance):
     )
 
 
+@pytest.mark.asyncio
+async def test_get_transfer_fee_reuses_composed_call(subtensor, mocker):
+    """Tests get_transfer_fee composes a transfer once but estimates its fee on every call."""
+    # Preps
+    fake_wallet = mocker.Mock(coldkeypub="coldkeypub", autospec=async_subtensor.Wallet)
+    mocked_compose_call = mocker.AsyncMock()
+    subtensor.substrate.compose_call = mocked_compose_call
+    mocked_get_payment_info = mocker.AsyncMock(
+        side_effect=[{"partialFee": 100}, {"partialFee": 200}]
+    )
+    subtensor.substrate.get_payment_info = mocked_get_payment_info
+
+    # Call
+    results = [
+        await subtensor.get_transfer_fee(wallet=fake_wallet, dest="dest", value=100)
+        for _ in range(2)
+    ]
+
+    # Assertions
+    mocked_compose_call.assert_awaited_once()
+    assert mocked_get_payment_info.await_count == 2
+    assert results == [
+        async_subtensor.Balance.from_rao(100),
+        async_subtensor.Balance.from_rao(200),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_get_transfer_fee_with_non_balance_accepted_value_type(subtensor, mocker):
     """Tests get_transfer_fee method with non balance accepted value type."""
@@ -683,8 +1161,8 @@ async def test_get_total_stake_for_coldkey(subtensor, mocker):
     fake_addresses = ("a1", "a2")
     fake_block_hash = None
 
-    mocked_substrate_create_storage_key = mocker.AsyncMock()
-    subtensor.substrate.create_storage_key = mocked_substrate_create_storage_key
+    mocked_substrate_create_storage_keys = mocker.AsyncMock()
+    subtensor.substrate.create_storage_keys = mocked_substrate_create_storage_keys
 
     mocked_batch_0_call = mocker.Mock(
         params=[
@@ -705,8 +1183,15 @@ async def test_get_total_stake_for_coldkey(subtensor, mocker):
         *fake_addresses, block_hash=fake_block_hash
     )
 
-    assert mocked_substrate_create_storage_key.call_count == len(fake_addresses)
-    mocked_substrate_query_multi.assert_called_once()
+    mocked_substrate_create_storage_keys.assert_awaited_once_with(
+        "SubtensorModule",
+        "TotalColdkeyStake",
+        [[address] for address in fake_addresses],
+        block_hash=fake_block_hash,
+    )
+    mocked_substrate_query_multi.assert_called_once_with(
+        mocked_substrate_create_storage_keys.return_value, block_hash=fake_block_hash
+    )
     assert result == {0: async_subtensor.Balance(mocked_batch_1_call)}
 
 
@@ -739,6 +1224,21 @@ async def test_get_total_stake_for_hotkey(subtensor, mocker):
     assert result == {0: async_subtensor.Balance(1)}
 
 
+@pytest.mark.asyncio
+async def test_get_total_stake_for_hotkey_raw(subtensor, mocker):
+    """Tests get_total_stake_for_hotkey method returning plain rao."""
+    # Preps
+    subtensor.substrate.query_multiple = mocker.AsyncMock(
+        return_value={"a1": 1, "a2": None}
+    )
+
+    # Call
+    result = await subtensor.get_total_stake_for_hotkey("a1", "a2", raw=True)
+
+    # Assertions
+    assert result == {"a1": 1, "a2": 0}
+
+
 @pytest.mark.parametrize(
     "records, response",
     [([(0, True), (1, False), (3, False), (3, True)], [0, 3]), ([], [])],
@@ -750,7 +1250,7 @@ async def test_get_netuids_for_hotkey(subtensor, mocker, records, response):
     # Preps
     fake_result = mocker.AsyncMock(autospec=list)
     fake_result.records = records
-    fake_result.__aiter__.return_value = iter(records)
+    fake_result.fetch_all.return_value = records
 
     mocked_substrate_query_map = mocker.AsyncMock(
         autospec=async_subtensor.AsyncSubstrateInterface.query_map,
@@ -771,12 +1271,31 @@ async def test_get_netuids_for_hotkey(subtensor, mocker, records, response):
         module="SubtensorModule",
         storage_function="IsNetworkMember",
         params=[fake_hotkey_ss58],
-        block_hash=fake_block_hash,
-        reuse_block_hash=True,
+        block_hash=subtensor.substrate.last_block_hash,
     )
     assert result == response
 
 
+@pytest.mark.asyncio
+async def test_get_netuids_for_hotkey_cached_per_block_hash(subtensor, mocker):
+    """Tests get_netuids_for_hotkey reads the map once per block hash and returns fresh lists."""
+    # Preps
+    fake_result = mocker.AsyncMock(autospec=list)
+    fake_result.records = [(1, True)]
+    fake_result.fetch_all.return_value = [(1, True)]
+    mocked_substrate_query_map = mocker.AsyncMock(return_value=fake_result)
+    subtensor.substrate.query_map = mocked_substrate_query_map
+
+    # Call
+    first = await subtensor.get_netuids_for_hotkey("hotkey", block_hash="block_hash")
+    first.append(2)
+    second = await subtensor.get_netuids_for_hotkey("hotkey", block_hash="block_hash")
+
+    # Assertions
+    mocked_substrate_query_map.assert_awaited_once()
+    assert second == [1]
+
+
 @pytest.mark.asyncio
 async def test_subnet_exists(subtensor, mocker):
     """Tests subnet_exists method ."""
@@ -798,74 +1317,370 @@ async def test_subnet_exists(subtensor, mocker):
     )
 
     # Asserts
-    mocked_substrate_query.assert_called_once_with(
-        module="SubtensorModule",
-        storage_function="NetworksAdded",
-        params=[fake_netuid],
-        block_hash=fake_block_hash,
-        reuse_block_hash=fake_reuse_block_hash,
-    )
-    assert result == mocked_substrate_query.return_value
+    mocked_substrate_query.assert_called_once_with(
+        module="SubtensorModule",
+        storage_function="NetworksAdded",
+        params=[fake_netuid],
+        block_hash=fake_block_hash,
+    )
+    assert result == mocked_substrate_query.return_value
+
+
+@pytest.mark.asyncio
+async def test_subnet_exists_reuse_block_is_cached_at_last_block_hash(
+    subtensor, mocker
+):
+    """Tests a reuse_block read is cached at the last-used block hash, not shared with head reads."""
+    # Preps
+    subtensor.substrate.last_block_hash = "last_block_hash"
+    mocked_substrate_query = mocker.AsyncMock(return_value=True)
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    await subtensor.subnet_exists(netuid=1, reuse_block=True)
+    await subtensor.subnet_exists(netuid=1, block_hash="last_block_hash")
+    await subtensor.subnet_exists(netuid=1)
+
+    # Asserts
+    assert mocked_substrate_query.await_count == 2
+    assert mocked_substrate_query.await_args_list[1].kwargs["block_hash"] is None
+
+
+@pytest.mark.asyncio
+async def test_subnet_exists_reuse_block_resolved_before_concurrent_reads(
+    subtensor, mocker
+):
+    """Tests a reuse_block read queries the block it is cached under, even when a concurrent read moves the last-used block hash."""
+    # Preps
+    subtensor.substrate.last_block_hash = "last_block_hash"
+    exists_at = {"last_block_hash": False, "other_block_hash": True}
+
+    async def fake_query(**kwargs):
+        # Mirrors AsyncSubstrateInterface.query, which records and reuses the last-used block hash.
+        block_hash = kwargs["block_hash"]
+        if block_hash:
+            subtensor.substrate.last_block_hash = block_hash
+        elif kwargs.get("reuse_block_hash"):
+            block_hash = subtensor.substrate.last_block_hash
+        return exists_at[block_hash]
+
+    mocked_substrate_query = mocker.AsyncMock(side_effect=fake_query)
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    results = await async_subtensor.asyncio.gather(
+        subtensor.subnet_exists(netuid=1, block_hash="other_block_hash"),
+        subtensor.subnet_exists(netuid=1, reuse_block=True),
+    )
+    cached = await subtensor.subnet_exists(netuid=1, block_hash="last_block_hash")
+
+    # Asserts
+    assert results == [True, False]
+    assert cached is False
+    assert mocked_substrate_query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_get_hyperparameter_happy_path(subtensor, mocker):
+    """Tests get_hyperparameter method with happy path."""
+    # Preps
+    fake_param_name = "param_name"
+    fake_netuid = 1
+    fake_block_hash = "block_hash"
+    fake_reuse_block_hash = True
+
+    # kind of fake subnet exists
+    mocked_subtensor_subnet_exists = mocker.AsyncMock(return_value=True)
+    subtensor.subnet_exists = mocked_subtensor_subnet_exists
+
+    mocked_substrate_query = mocker.AsyncMock(
+        autospec=async_subtensor.AsyncSubstrateInterface.query
+    )
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    result = await subtensor.get_hyperparameter(
+        param_name=fake_param_name,
+        netuid=fake_netuid,
+        block_hash=fake_block_hash,
+        reuse_block=fake_reuse_block_hash,
+    )
+
+    # Assertions
+    mocked_subtensor_subnet_exists.assert_called_once()
+    mocked_substrate_query.assert_called_once_with(
+        module="SubtensorModule",
+        storage_function=fake_param_name,
+        params=[fake_netuid],
+        block_hash=fake_block_hash,
+    )
+    assert result == mocked_substrate_query.return_value
+
+
+@pytest.mark.asyncio
+async def test_get_hyperparameter_if_subnet_does_not_exist(subtensor, mocker):
+    """Tests get_hyperparameter method if subnet does not exist."""
+    # Preps
+    # kind of fake subnet doesn't exist
+    mocked_subtensor_subnet_exists = mocker.AsyncMock(return_value=False)
+    subtensor.subnet_exists = mocked_subtensor_subnet_exists
+
+    mocked_substrate_query = mocker.AsyncMock(
+        autospec=async_subtensor.AsyncSubstrateInterface.query
+    )
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    result = await subtensor.get_hyperparameter(mocker.Mock(), mocker.Mock())
+
+    # Assertions
+    mocked_subtensor_subnet_exists.assert_called_once()
+    mocked_substrate_query.assert_not_called()
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_get_hyperparameter_is_cached_per_block_hash(subtensor, mocker):
+    """Tests get_hyperparameter only queries the chain once per block hash."""
+    # Preps
+    mocked_substrate_query = mocker.AsyncMock(return_value=True)
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    first = await subtensor.get_hyperparameter("Tempo", 1, block_hash="hash_1")
+    second = await subtensor.get_hyperparameter("Tempo", 1, block_hash="hash_1")
+    await subtensor.get_hyperparameter("Tempo", 1, block_hash="hash_2")
+
+    # Asserts
+    assert first == second == mocked_substrate_query.return_value
+    # NetworksAdded + Tempo for each distinct block hash
+    assert mocked_substrate_query.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_get_hyperparameter_is_not_cached_without_block_hash(subtensor, mocker):
+    """Tests get_hyperparameter always queries the chain head when no block hash is given."""
+    # Preps
+    mocked_substrate_query = mocker.AsyncMock(return_value=True)
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    await subtensor.get_hyperparameter("Tempo", 1)
+    await subtensor.get_hyperparameter("Tempo", 1)
+
+    # Asserts
+    assert mocked_substrate_query.await_count == 4
+
+
+@pytest.mark.asyncio
+async def test_get_hyperparameters(subtensor, mocker):
+    """Tests get_hyperparameters checks the subnet once and returns every value by name."""
+    # Preps
+    fake_block_hash = "block_hash"
+    mocked_subnet_exists = mocker.AsyncMock(return_value=True)
+    subtensor.subnet_exists = mocked_subnet_exists
+
+    async def fake_query(storage_function, **kwargs):
+        return f"{storage_function}_value"
+
+    mocked_substrate_query = mocker.AsyncMock(side_effect=fake_query)
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    result = await subtensor.get_hyperparameters(
+        ["Tempo", "Difficulty"], netuid=1, block_hash=fake_block_hash
+    )
+
+    # Asserts
+    mocked_subnet_exists.assert_awaited_once_with(1, fake_block_hash)
+    assert mocked_substrate_query.await_count == 2
+    assert result == {"Tempo": "Tempo_value", "Difficulty": "Difficulty_value"}
+
+
+@pytest.mark.asyncio
+async def test_get_hyperparameters_pins_chain_head(subtensor, mocker):
+    """Tests get_hyperparameters resolves the chain head once and queries every value at it."""
+    # Preps
+    fake_block_hash = "head_hash"
+    subtensor.substrate.get_chain_head = mocker.AsyncMock(return_value=fake_block_hash)
+    mocked_subnet_exists = mocker.AsyncMock(return_value=True)
+    subtensor.subnet_exists = mocked_subnet_exists
+    mocked_substrate_query = mocker.AsyncMock(return_value="value")
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    result = await subtensor.get_hyperparameters(["Tempo", "Difficulty"], netuid=1)
+
+    # Asserts
+    subtensor.substrate.get_chain_head.assert_awaited_once()
+    mocked_subnet_exists.assert_awaited_once_with(1, fake_block_hash)
+    assert all(
+        call.kwargs["block_hash"] == fake_block_hash
+        for call in mocked_substrate_query.await_args_list
+    )
+    assert result == {"Tempo": "value", "Difficulty": "value"}
+
+
+@pytest.mark.asyncio
+async def test_get_hyperparameters_without_subnet(subtensor, mocker):
+    """Tests get_hyperparameters returns None without querying when the subnet does not exist."""
+    # Preps
+    subtensor.subnet_exists = mocker.AsyncMock(return_value=False)
+    mocked_substrate_query = mocker.AsyncMock()
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    result = await subtensor.get_hyperparameters(["Tempo", "Difficulty"], netuid=1)
+
+    # Asserts
+    mocked_substrate_query.assert_not_called()
+    assert result is None
+
+
+@pytest.mark.asyncio
+async def test_prefetch_hyperparameters(subtensor, mocker):
+    """Tests prefetched hyperparameters are served without issuing the queries again."""
+    # Preps
+    fake_block_hash = "block_hash"
+    subtensor.subnet_exists = mocker.AsyncMock(return_value=True)
+
+    async def fake_query(storage_function, params, **kwargs):
+        return f"{storage_function}_{params[0]}"
+
+    mocked_substrate_query = mocker.AsyncMock(side_effect=fake_query)
+    subtensor.substrate.query = mocked_substrate_query
+
+    # Call
+    subtensor.prefetch_hyperparameters(["Tempo", "Difficulty"], [1, 2], fake_block_hash)
+    subtensor.prefetch_hyperparameters(["Tempo"], [1], fake_block_hash)
+    result = await subtensor.get_hyperparameters(
+        ["Tempo", "Difficulty"], netuid=2, block_hash=fake_block_hash
+    )
+    cached = await subtensor.get_hyperparameter("Tempo", 1, fake_block_hash)
+
+    # Asserts
+    assert mocked_substrate_query.await_count == 4
+    assert result == {"Tempo": "Tempo_2", "Difficulty": "Difficulty_2"}
+    assert cached == "Tempo_1"
+
+
+@pytest.mark.asyncio
+async def test_prefetch_hyperparameters_failure_is_logged_and_evicted(
+    subtensor, mocker
+):
+    """Tests a failed prefetch is logged, dropped from the in-flight map and retried on the next read."""
+    # Preps
+    fake_block_hash = "block_hash"
+    mocked_logging_debug = mocker.patch.object(async_subtensor.logging, "debug")
+    subtensor.substrate.query = mocker.AsyncMock(
+        side_effect=[async_subtensor.SubstrateRequestException("boom"), 10]
+    )
+
+    # Call
+    subtensor.prefetch_hyperparameters(["Tempo"], [1], fake_block_hash)
+    await async_subtensor.asyncio.sleep(0)
+    await async_subtensor.asyncio.sleep(0)
+    result = await subtensor._query_hyperparameter("Tempo", 1, fake_block_hash)
+
+    # Asserts
+    mocked_logging_debug.assert_called_once()
+    assert not subtensor._inflight
+    assert result == 10
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_survives_new_instance(mocker, tmp_path):
+    """Tests block-pinned plain results are read back from the on-disk cache by a new instance."""
+    # Preps
+    cache_path = str(tmp_path / "rpc_cache")
+    fake_block_hash = "block_hash"
+    first = async_subtensor.AsyncSubtensor(persistent_cache_path=cache_path)
+    first.substrate.query = mocker.AsyncMock(return_value="0x01")
+
+    # Call
+    await first._cached(
+        ("get_delegates",), fake_block_hash, lambda: first.substrate.query()
+    )
+    await first.__aexit__(None, None, None)
+
+    second = async_subtensor.AsyncSubtensor(persistent_cache_path=cache_path)
+    second.substrate.query = mocker.AsyncMock()
+    result = await second._cached(
+        ("get_delegates",), fake_block_hash, lambda: second.substrate.query()
+    )
+
+    # Asserts
+    second.substrate.query.assert_not_called()
+    assert result == "0x01"
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_reopens_after_exit(mocker, tmp_path):
+    """Tests the on-disk cache is reopened when an instance is used again after exiting."""
+    # Preps
+    cache_path = str(tmp_path / "rpc_cache")
+    fake_block_hash = "block_hash"
+    subtensor = async_subtensor.AsyncSubtensor(persistent_cache_path=cache_path)
+    subtensor.substrate.query = mocker.AsyncMock(return_value="0x01")
+
+    # Call
+    await subtensor._cached(
+        ("get_delegates",), fake_block_hash, lambda: subtensor.substrate.query()
+    )
+    await subtensor.__aexit__(None, None, None)
+    await subtensor._cached(
+        ("get_delegates",), "other_block_hash", lambda: subtensor.substrate.query()
+    )
+    await subtensor.__aexit__(None, None, None)
+
+    # Asserts
+    with async_subtensor.shelve.open(cache_path) as disk_cache:
+        assert len(disk_cache) == 2
 
 
 @pytest.mark.asyncio
-async def test_get_hyperparameter_happy_path(subtensor, mocker):
-    """Tests get_hyperparameter method with happy path."""
+async def test_concurrent_identical_reads_are_coalesced(subtensor, mocker):
+    """Tests concurrent identical reads share one substrate request."""
     # Preps
-    fake_param_name = "param_name"
-    fake_netuid = 1
-    fake_block_hash = "block_hash"
-    fake_reuse_block_hash = True
+    release = async_subtensor.asyncio.Event()
 
-    # kind of fake subnet exists
-    mocked_subtensor_subnet_exists = mocker.AsyncMock(return_value=True)
-    subtensor.subnet_exists = mocked_subtensor_subnet_exists
+    async def fake_query(**kwargs):
+        await release.wait()
+        return 42
 
-    mocked_substrate_query = mocker.AsyncMock(
-        autospec=async_subtensor.AsyncSubstrateInterface.query
-    )
+    mocked_substrate_query = mocker.AsyncMock(side_effect=fake_query)
     subtensor.substrate.query = mocked_substrate_query
 
     # Call
-    result = await subtensor.get_hyperparameter(
-        param_name=fake_param_name,
-        netuid=fake_netuid,
-        block_hash=fake_block_hash,
-        reuse_block=fake_reuse_block_hash,
+    pending = async_subtensor.asyncio.gather(
+        subtensor.get_total_subnets(),
+        subtensor.get_total_subnets(),
+        subtensor.get_total_subnets(),
     )
+    await async_subtensor.asyncio.sleep(0)
+    release.set()
+    result = await pending
 
-    # Assertions
-    mocked_subtensor_subnet_exists.assert_called_once()
-    mocked_substrate_query.assert_called_once_with(
-        module="SubtensorModule",
-        storage_function=fake_param_name,
-        params=[fake_netuid],
-        block_hash=fake_block_hash,
-        reuse_block_hash=fake_reuse_block_hash,
-    )
-    assert result == mocked_substrate_query.return_value
+    # Asserts
+    assert result == [42, 42, 42]
+    mocked_substrate_query.assert_awaited_once()
+    assert subtensor._inflight == {}
 
 
 @pytest.mark.asyncio
-async def test_get_hyperparameter_if_subnet_does_not_exist(subtensor, mocker):
-    """Tests get_hyperparameter method if subnet does not exist."""
+async def test_invalidate_block_cache(subtensor, mocker):
+    """Tests invalidate_block_cache drops cached reads."""
     # Preps
-    # kind of fake subnet doesn't exist
-    mocked_subtensor_subnet_exists = mocker.AsyncMock(return_value=False)
-    subtensor.subnet_exists = mocked_subtensor_subnet_exists
-
-    mocked_substrate_query = mocker.AsyncMock(
-        autospec=async_subtensor.AsyncSubstrateInterface.query
-    )
+    mocked_substrate_query = mocker.AsyncMock(return_value=True)
     subtensor.substrate.query = mocked_substrate_query
+    await subtensor.subnet_exists(1, block_hash="hash_1")
 
     # Call
-    result = await subtensor.get_hyperparameter(mocker.Mock(), mocker.Mock())
+    subtensor.invalidate_block_cache()
+    await subtensor.subnet_exists(1, block_hash="hash_1")
 
-    # Assertions
-    mocked_subtensor_subnet_exists.assert_called_once()
-    mocked_substrate_query.assert_not_called()
-    assert result is None
+    # Asserts
+    assert mocked_substrate_query.await_count == 2
 
 
 @pytest.mark.parametrize(
@@ -946,7 +1761,6 @@ async def test_get_existential_deposit_happy_path(subtensor, mocker):
         module_name="Balances",
         constant_name="ExistentialDeposit",
         block_hash=fake_block_hash,
-        reuse_block_hash=fake_reuse_block_hash,
     )
     spy_balance_from_rao.assert_called_once_with(
         mocked_substrate_get_constant.return_value
@@ -954,6 +1768,26 @@ async def test_get_existential_deposit_happy_path(subtensor, mocker):
     assert result == async_subtensor.Balance(mocked_substrate_get_constant.return_value)
 
 
+@pytest.mark.asyncio
+async def test_get_existential_deposit_reuse_block_not_shared_with_head(
+    subtensor, mocker
+):
+    """Tests a reuse_block read is not served to, or coalesced with, a chain head read."""
+    # Preps
+    subtensor.substrate.last_block_hash = "last_block_hash"
+    mocked_substrate_get_constant = mocker.AsyncMock(return_value=1)
+    subtensor.substrate.get_constant = mocked_substrate_get_constant
+
+    # Call
+    await async_subtensor.asyncio.gather(
+        subtensor.get_existential_deposit(reuse_block=True),
+        subtensor.get_existential_deposit(),
+    )
+
+    # Asserts
+    assert mocked_substrate_get_constant.await_count == 2
+
+
 @pytest.mark.asyncio
 async def test_get_existential_deposit_raise_exception(subtensor, mocker):
     """Tests get_existential_deposit method raise Exception."""
@@ -978,7 +1812,6 @@ async def test_get_existential_deposit_raise_exception(subtensor, mocker):
         module_name="Balances",
         constant_name="ExistentialDeposit",
         block_hash=fake_block_hash,
-        reuse_block_hash=fake_reuse_block_hash,
     )
     spy_balance_from_rao.assert_not_called()
 
@@ -1027,19 +1860,19 @@ async def test_neurons(subtensor, mocker):
 
 
 @pytest.mark.parametrize(
-    "fake_hex_bytes_result, response",
-    [(None, []), ("0xaabbccdd", b"\xaa\xbb\xcc\xdd")],
+    "fake_bytes_result",
+    [None, b"\xaa\xbb\xcc\xdd"],
     ids=["none", "with data"],
 )
 @pytest.mark.asyncio
-async def test_neurons_lite(subtensor, mocker, fake_hex_bytes_result, response):
+async def test_neurons_lite(subtensor, mocker, fake_bytes_result):
     """Tests neurons_lite method."""
     # Preps
     fake_netuid = 1
     fake_block_hash = "block_hash"
     fake_reuse_block_hash = True
 
-    mocked_query_runtime_api = mocker.AsyncMock(return_value=fake_hex_bytes_result)
+    mocked_query_runtime_api = mocker.AsyncMock(return_value=fake_bytes_result)
     subtensor.query_runtime_api = mocked_query_runtime_api
 
     mocked_neuron_info_lite_list_from_vec_u8 = mocker.Mock()
@@ -1061,11 +1894,11 @@ async def test_neurons_lite(subtensor, mocker, fake_hex_bytes_result, response):
         method="get_neurons_lite",
         params=[fake_netuid],
         block_hash=fake_block_hash,
-        reuse_block=fake_reuse_block_hash,
+        raw=True,
     )
-    if fake_hex_bytes_result:
+    if fake_bytes_result:
         mocked_neuron_info_lite_list_from_vec_u8.assert_called_once_with(
-            bytes.fromhex(fake_hex_bytes_result[2:])
+            fake_bytes_result
         )
         assert result == mocked_neuron_info_lite_list_from_vec_u8.return_value
     else:
@@ -1106,6 +1939,28 @@ async def test_neuron_for_uid_happy_path(subtensor, mocker):
     assert result == mocked_neuron_info_from_vec_u8.return_value
 
 
+@pytest.mark.asyncio
+async def test_neuron_for_uid_coalesces_concurrent_calls(subtensor, mocker):
+    """Tests concurrent neuron_for_uid calls for the same neuron share one request."""
+    # Preps
+    mocked_substrate_rpc_request = mocker.AsyncMock(
+        return_value={"result": b"some_result"}
+    )
+    subtensor.substrate.rpc_request = mocked_substrate_rpc_request
+    async_subtensor.NeuronInfo.from_vec_u8 = mocker.Mock()
+
+    # Call
+    await async_subtensor.asyncio.gather(
+        subtensor.neuron_for_uid(uid=1, netuid=2),
+        subtensor.neuron_for_uid(uid=1, netuid=2),
+    )
+
+    # Asserts
+    mocked_substrate_rpc_request.assert_awaited_once_with(
+        method="neuronInfo_getNeuron", params=[2, 1]
+    )
+
+
 @pytest.mark.asyncio
 async def test_neuron_for_uid_with_none_uid(subtensor, mocker):
     """Tests neuron_for_uid method when uid is None."""
@@ -1156,6 +2011,27 @@ async def test_neuron_for_uid(subtensor, mocker):
     assert result == mocked_null_neuron.return_value
 
 
+@pytest.mark.parametrize(
+    "block_hash, reuse_block, expected",
+    [
+        ("fake_block_hash", False, "fake_block_hash"),
+        ("fake_block_hash", True, "fake_block_hash"),
+        (None, True, "last_block_hash"),
+        (None, False, None),
+    ],
+)
+def test_determine_block_hash(subtensor, block_hash, reuse_block, expected):
+    """Tests _determine_block_hash picks the explicit, last-used or chain head block hash."""
+    # Preps
+    subtensor.substrate.last_block_hash = "last_block_hash"
+
+    # Call
+    result = subtensor._determine_block_hash(block_hash, reuse_block)
+
+    # Asserts
+    assert result == expected
+
+
 @pytest.mark.asyncio
 async def test_get_delegated_no_block_hash_no_reuse(subtensor, mocker):
     """Tests get_delegated method with no block_hash and reuse_block=False."""
@@ -1299,11 +2175,47 @@ async def test_query_identity_successful(subtensor, mocker):
         storage_function="IdentityOf",
         params=[fake_key],
         block_hash=fake_block_hash,
-        reuse_block_hash=False,
     )
     assert result == {"stake": "01 02"}
 
 
+@pytest.mark.asyncio
+async def test_query_identity_reuse_block_is_cached_at_last_block_hash(
+    subtensor, mocker
+):
+    """Tests a reuse_block identity read is cached at the last-used block hash."""
+    # Preps
+    subtensor.substrate.last_block_hash = "last_block_hash"
+    mocked_query = mocker.AsyncMock(return_value=None)
+    subtensor.substrate.query = mocked_query
+
+    # Call
+    await subtensor.query_identity(key="test_key", reuse_block=True)
+    await subtensor.query_identity(key="test_key", block_hash="last_block_hash")
+    await subtensor.query_identity(key="test_key")
+
+    # Asserts
+    assert mocked_query.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_query_identity_cached_result_not_shared(subtensor, mocker):
+    """Tests decoding and changing one cached identity does not change the next caller's result."""
+    # Preps
+    subtensor.substrate.query = mocker.AsyncMock(
+        return_value={"info": {"name": {"Raw1": ((106, 111, 104, 110),)}}}
+    )
+
+    # Call
+    first = await subtensor.query_identity(key="test_key", block_hash="block_hash")
+    first["name"] = "changed"
+    second = await subtensor.query_identity(key="test_key", block_hash="block_hash")
+
+    # Asserts
+    subtensor.substrate.query.assert_awaited_once()
+    assert second == {"name": "john"}
+
+
 @pytest.mark.asyncio
 async def test_query_identity_no_info(subtensor, mocker):
     """Tests query_identity method when no identity info is returned."""
@@ -1322,7 +2234,6 @@ async def test_query_identity_no_info(subtensor, mocker):
         storage_function="IdentityOf",
         params=[fake_key],
         block_hash=None,
-        reuse_block_hash=False,
     )
     assert result == {}
 
@@ -1352,7 +2263,6 @@ async def test_query_identity_type_error(subtensor, mocker):
         storage_function="IdentityOf",
         params=[fake_key],
         block_hash=None,
-        reuse_block_hash=False,
     )
     assert result == {}
 
@@ -1368,11 +2278,11 @@ async def test_weights_successful(subtensor, mocker):
         (1, [(0, 15), (2, 25)]),
     ]
 
-    async def mock_query_map(**_):
-        for uid, w in fake_weights:
-            yield uid, w
-
-    mocker.patch.object(subtensor.substrate, "query_map", side_effect=mock_query_map)
+    mocker.patch.object(
+        subtensor.substrate,
+        "query_map",
+        return_value=mocker.Mock(fetch_all=mocker.AsyncMock(return_value=fake_weights)),
+    )
 
     # Call
     result = await subtensor.weights(netuid=fake_netuid, block_hash=fake_block_hash)
@@ -1383,10 +2293,90 @@ async def test_weights_successful(subtensor, mocker):
         storage_function="Weights",
         params=[fake_netuid],
         block_hash=fake_block_hash,
+        page_size=async_subtensor.NEURON_MAP_PAGE_SIZE,
     )
     assert result == fake_weights
 
 
+@pytest.mark.asyncio
+async def test_weights_cached_per_block_hash(subtensor, mocker):
+    """Tests weights only queries the map once per netuid and block hash."""
+    # Preps
+    fake_weights = [(0, [(1, 10)])]
+
+    mocker.patch.object(
+        subtensor.substrate,
+        "query_map",
+        return_value=mocker.Mock(fetch_all=mocker.AsyncMock(return_value=fake_weights)),
+    )
+
+    # Call
+    first = await subtensor.weights(netuid=1, block_hash="block_hash")
+    second = await subtensor.weights(netuid=1, block_hash="block_hash")
+
+    # Asserts
+    subtensor.substrate.query_map.assert_called_once()
+    assert first == second == fake_weights
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_weights_and_bonds_cached_results_not_shared(subtensor, mocker):
+    """Tests changing the rows of a cached weights or bonds result does not change the next caller's result."""
+    # Preps
+    mocker.patch.object(
+        subtensor.substrate,
+        "query_map",
+        return_value=mocker.Mock(
+            fetch_all=mocker.AsyncMock(return_value=[(0, [(1, 10)])])
+        ),
+    )
+
+    # Call
+    for method in (subtensor.weights, subtensor.bonds):
+        first = await method(netuid=1, block_hash="block_hash")
+        first[0][1].append((2, 20))
+        second = await method(netuid=1, block_hash="block_hash")
+
+        # Asserts
+        assert second == [(0, [(1, 10)])]
+
+
+@pytest.mark.asyncio
+async def test_weights_csr(subtensor, mocker):
+    """Tests weights_csr lays the weights out as CSR rows indexed by uid."""
+    # Preps
+    fake_weights = [
+        (2, [(0, 15)]),
+        (0, [(1, 10), (2, 20)]),
+    ]
+    subtensor.weights = mocker.AsyncMock(return_value=fake_weights)
+
+    # Call
+    indptr, indices, data = await subtensor.weights_csr(netuid=1, block_hash="hash")
+
+    # Asserts
+    subtensor.weights.assert_awaited_once_with(netuid=1, block_hash="hash")
+    assert indptr.tolist() == [0, 2, 2, 3]
+    assert indices.tolist() == [1, 2, 0]
+    assert data.tolist() == [10, 20, 15]
+    assert indices.dtype == async_subtensor.np.uint16
+
+
+@pytest.mark.asyncio
+async def test_weights_csr_empty(subtensor, mocker):
+    """Tests weights_csr returns empty arrays when no weights are set."""
+    # Preps
+    subtensor.weights = mocker.AsyncMock(return_value=[])
+
+    # Call
+    indptr, indices, data = await subtensor.weights_csr(netuid=1)
+
+    # Asserts
+    assert indptr.tolist() == [0]
+    assert indices.tolist() == data.tolist() == []
+
+
 @pytest.mark.asyncio
 async def test_bonds(subtensor, mocker):
     """Tests bonds method with successful bond distribution retrieval."""
@@ -1398,11 +2388,11 @@ async def test_bonds(subtensor, mocker):
         (1, [(0, 150), (2, 250)]),
     ]
 
-    async def mock_query_map(**_):
-        for uid, b in fake_bonds:
-            yield uid, b
-
-    mocker.patch.object(subtensor.substrate, "query_map", side_effect=mock_query_map)
+    mocker.patch.object(
+        subtensor.substrate,
+        "query_map",
+        return_value=mocker.Mock(fetch_all=mocker.AsyncMock(return_value=fake_bonds)),
+    )
 
     # Call
     result = await subtensor.bonds(netuid=fake_netuid, block_hash=fake_block_hash)
@@ -1413,6 +2403,7 @@ async def test_bonds(subtensor, mocker):
         storage_function="Bonds",
         params=[fake_netuid],
         block_hash=fake_block_hash,
+        page_size=async_subtensor.NEURON_MAP_PAGE_SIZE,
     )
     assert result == fake_bonds
 
@@ -1442,7 +2433,6 @@ async def test_does_hotkey_exist_true(subtensor, mocker):
         storage_function="Owner",
         params=[fake_hotkey_ss58],
         block_hash=fake_block_hash,
-        reuse_block_hash=False,
     )
     mocked_decode_account_id.assert_called_once_with(fake_query_result[0])
     assert result is True
@@ -1460,7 +2450,7 @@ async def test_does_hotkey_exist_false_for_specific_account(subtensor, mocker):
 
     # Mock the decode_account_id function to return the specific account ID that should be ignored
     mocked_decode_account_id = mocker.Mock(
-        return_value="5C4hrfjw9DjXZTzV3MwzrrAr9P1MJhSrvWGWqi1eSuyUpnhM"
+        return_value=async_subtensor.BURN_ADDRESS_SS58
     )
     mocker.patch.object(async_subtensor, "decode_account_id", mocked_decode_account_id)
 
@@ -1473,7 +2463,6 @@ async def test_does_hotkey_exist_false_for_specific_account(subtensor, mocker):
         storage_function="Owner",
         params=[fake_hotkey_ss58],
         block_hash=None,
-        reuse_block_hash=False,
     )
     mocked_decode_account_id.assert_called_once_with(fake_query_result[0])
     assert result is False
@@ -1493,9 +2482,6 @@ async def test_get_hotkey_owner_successful(subtensor, mocker):
     mocked_decode_account_id = mocker.Mock(return_value="decoded_owner_account_id")
     mocker.patch.object(async_subtensor, "decode_account_id", mocked_decode_account_id)
 
-    mocked_does_hotkey_exist = mocker.AsyncMock(return_value=True)
-    subtensor.does_hotkey_exist = mocked_does_hotkey_exist
-
     # Call
     result = await subtensor.get_hotkey_owner(
         hotkey_ss58=fake_hotkey_ss58, block_hash=fake_block_hash
@@ -1509,9 +2495,6 @@ async def test_get_hotkey_owner_successful(subtensor, mocker):
         block_hash=fake_block_hash,
     )
     mocked_decode_account_id.assert_called_once_with(fake_owner_account_id)
-    mocked_does_hotkey_exist.assert_awaited_once_with(
-        fake_hotkey_ss58, block_hash=fake_block_hash
-    )
     assert result == "decoded_owner_account_id"
 
 
@@ -1545,8 +2528,8 @@ async def test_get_hotkey_owner_non_existent_hotkey(subtensor, mocker):
 
 
 @pytest.mark.asyncio
-async def test_get_hotkey_owner_exists_but_does_not_exist_flag_false(subtensor, mocker):
-    """Tests get_hotkey_owner method when decode_account_id returns a value but does_hotkey_exist returns False."""
+async def test_get_hotkey_owner_burn_address(subtensor, mocker):
+    """Tests get_hotkey_owner method when the hotkey is owned by the burn address."""
     # Preps
     fake_hotkey_ss58 = "valid_hotkey"
     fake_block_hash = "block_hash"
@@ -1555,31 +2538,43 @@ async def test_get_hotkey_owner_exists_but_does_not_exist_flag_false(subtensor,
     mocked_query = mocker.AsyncMock(return_value=[fake_owner_account_id])
     subtensor.substrate.query = mocked_query
 
-    mocked_decode_account_id = mocker.Mock(return_value="decoded_owner_account_id")
+    mocked_decode_account_id = mocker.Mock(
+        return_value=async_subtensor.BURN_ADDRESS_SS58
+    )
     mocker.patch.object(async_subtensor, "decode_account_id", mocked_decode_account_id)
 
-    mocked_does_hotkey_exist = mocker.AsyncMock(return_value=False)
-    subtensor.does_hotkey_exist = mocked_does_hotkey_exist
-
     # Call
     result = await subtensor.get_hotkey_owner(
         hotkey_ss58=fake_hotkey_ss58, block_hash=fake_block_hash
     )
 
     # Asserts
-    mocked_query.assert_called_once_with(
-        module="SubtensorModule",
-        storage_function="Owner",
-        params=[fake_hotkey_ss58],
-        block_hash=fake_block_hash,
-    )
+    mocked_query.assert_awaited_once()
     mocked_decode_account_id.assert_called_once_with(fake_owner_account_id)
-    mocked_does_hotkey_exist.assert_awaited_once_with(
-        fake_hotkey_ss58, block_hash=fake_block_hash
-    )
     assert result is None
 
 
+@pytest.mark.asyncio
+async def test_hotkey_owner_reads_are_cached_per_block_hash(subtensor, mocker):
+    """Tests does_hotkey_exist and get_hotkey_owner share one Owner query at the same block hash."""
+    # Preps
+    fake_block_hash = "block_hash"
+    mocked_query = mocker.AsyncMock(return_value=["owner_account_id"])
+    subtensor.substrate.query = mocked_query
+    mocker.patch.object(
+        async_subtensor, "decode_account_id", return_value="decoded_owner"
+    )
+
+    # Call
+    exists = await subtensor.does_hotkey_exist("hotkey", block_hash=fake_block_hash)
+    owner = await subtensor.get_hotkey_owner("hotkey", block_hash=fake_block_hash)
+
+    # Asserts
+    mocked_query.assert_awaited_once()
+    assert exists is True
+    assert owner == "decoded_owner"
+
+
 @pytest.mark.asyncio
 async def test_sign_and_send_extrinsic_success_finalization(subtensor, mocker):
     """Tests sign_and_send_extrinsic when the extrinsic is successfully finalized."""
@@ -1849,7 +2844,7 @@ async def test_get_subnet_hyperparameters_success(subtensor, mocker):
     mocked_query_runtime_api = mocker.AsyncMock(return_value=fake_hex_bytes_result)
     subtensor.query_runtime_api = mocked_query_runtime_api
 
-    mocked_from_vec_u8 = mocker.Mock()
+    mocked_from_vec_u8 = mocker.Mock(return_value=SimpleNamespace(tempo=360))
     mocker.patch.object(
         async_subtensor.SubnetHyperparameters, "from_vec_u8", mocked_from_vec_u8
     )
@@ -1903,7 +2898,7 @@ async def test_get_subnet_hyperparameters_without_0x_prefix(subtensor, mocker):
     mocked_query_runtime_api = mocker.AsyncMock(return_value=fake_hex_bytes_result)
     subtensor.query_runtime_api = mocked_query_runtime_api
 
-    mocked_from_vec_u8 = mocker.Mock()
+    mocked_from_vec_u8 = mocker.Mock(return_value=SimpleNamespace(tempo=360))
     mocker.patch.object(
         async_subtensor.SubnetHyperparameters, "from_vec_u8", mocked_from_vec_u8
     )
@@ -1923,6 +2918,38 @@ async def test_get_subnet_hyperparameters_without_0x_prefix(subtensor, mocker):
     assert result == mocked_from_vec_u8.return_value
 
 
+@pytest.mark.asyncio
+async def test_get_subnet_hyperparameters_decodes_once_per_block_hash(
+    subtensor, mocker
+):
+    """Tests get_subnet_hyperparameters reuses the decoded result at a pinned block."""
+    # Preps
+    fake_netuid = 1
+    fake_block_hash = "block_hash"
+
+    mocked_query_runtime_api = mocker.AsyncMock(return_value="0xaabbccdd")
+    subtensor.query_runtime_api = mocked_query_runtime_api
+
+    mocked_from_vec_u8 = mocker.Mock(return_value=SimpleNamespace(tempo=360))
+    mocker.patch.object(
+        async_subtensor.SubnetHyperparameters, "from_vec_u8", mocked_from_vec_u8
+    )
+
+    # Call
+    first = await subtensor.get_subnet_hyperparameters(
+        netuid=fake_netuid, block_hash=fake_block_hash
+    )
+    second = await subtensor.get_subnet_hyperparameters(
+        netuid=fake_netuid, block_hash=fake_block_hash
+    )
+
+    # Asserts
+    mocked_query_runtime_api.assert_awaited_once()
+    mocked_from_vec_u8.assert_called_once()
+    assert first == second == mocked_from_vec_u8.return_value
+    assert first is not second
+
+
 @pytest.mark.asyncio
 async def test_get_vote_data_success(subtensor, mocker):
     """Tests get_vote_data when voting data is successfully retrieved."""
@@ -2005,7 +3032,11 @@ async def test_get_delegate_identities(subtensor, mocker):
         },
     }
 
-    mocked_query_map = mocker.AsyncMock(return_value=fake_chain_data)
+    mocked_query_map = mocker.AsyncMock(
+        return_value=mocker.Mock(
+            fetch_all=mocker.AsyncMock(return_value=fake_chain_data)
+        )
+    )
     subtensor.substrate.query_map = mocked_query_map
 
     mocked_decode_account_id = mocker.Mock(side_effect=lambda ss58: ss58)
@@ -2037,6 +3068,51 @@ async def test_get_delegate_identities(subtensor, mocker):
     assert result["delegate1_ss58"].display == "GitHub Delegate 1"
     assert result["delegate2_ss58"].display == ""
     assert result["delegate3_ss58"].display == "GitHub Delegate 3"
+    mock_response.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_get_delegate_identities_releases_response_on_error(subtensor, mocker):
+    """Tests get_delegate_identities releases the HTTP response when reading it fails."""
+    # Preps
+    subtensor.substrate.query_map = mocker.AsyncMock(
+        return_value=mocker.Mock(fetch_all=mocker.AsyncMock(return_value=[]))
+    )
+    mock_response = mocker.Mock()
+    mock_response.ok = True
+    mock_response.json = mocker.AsyncMock(side_effect=ValueError("bad json"))
+    mocker.patch(
+        "aiohttp.ClientSession.get", mocker.AsyncMock(return_value=mock_response)
+    )
+
+    # Call
+    with pytest.raises(ValueError):
+        await subtensor.get_delegate_identities()
+
+    # Asserts
+    mock_response.release.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_http_session_is_reused_and_closed_on_exit(subtensor, mocker):
+    """Tests the HTTP session is created once, reused, and closed when the context exits."""
+    # Preps
+    mocked_client_session = mocker.patch.object(
+        async_subtensor.aiohttp, "ClientSession"
+    )
+    mocked_client_session.return_value.closed = False
+    mocked_client_session.return_value.close = mocker.AsyncMock()
+
+    # Call
+    first = subtensor._get_http_session()
+    second = subtensor._get_http_session()
+    await subtensor.__aexit__(None, None, None)
+
+    # Asserts
+    assert first is second
+    mocked_client_session.assert_called_once()
+    first.close.assert_awaited_once()
+    assert subtensor._http_session is None
 
 
 @pytest.mark.asyncio
@@ -2097,8 +3173,11 @@ async def test_get_uid_for_hotkey_on_subnet_registered(subtensor, mocker):
     fake_block_hash = "block_hash"
     fake_uid = 123
 
-    mocked_query = mocker.AsyncMock(return_value=fake_uid)
-    subtensor.substrate.query = mocked_query
+    fake_storage_key = mocker.Mock(to_hex=mocker.Mock(return_value="0xstorage_key"))
+    mocked_create_storage_key = mocker.AsyncMock(return_value=fake_storage_key)
+    subtensor.substrate.create_storage_key = mocked_create_storage_key
+    mocked_rpc_request = mocker.AsyncMock(return_value={"result": "0x7b00"})
+    subtensor.substrate.rpc_request = mocked_rpc_request
 
     # Call
     result = await subtensor.get_uid_for_hotkey_on_subnet(
@@ -2106,10 +3185,15 @@ async def test_get_uid_for_hotkey_on_subnet_registered(subtensor, mocker):
     )
 
     # Asserts
-    mocked_query.assert_called_once_with(
-        module="SubtensorModule",
-        storage_function="Uids",
-        params=[fake_netuid, fake_hotkey_ss58],
+    mocked_create_storage_key.assert_called_once_with(
+        "SubtensorModule",
+        "Uids",
+        [fake_netuid, fake_hotkey_ss58],
+        block_hash=fake_block_hash,
+    )
+    mocked_rpc_request.assert_called_once_with(
+        "state_getStorage",
+        ["0xstorage_key"],
         block_hash=fake_block_hash,
     )
     assert result == fake_uid
@@ -2124,8 +3208,11 @@ async def test_get_uid_for_hotkey_on_subnet_not_registered(subtensor, mocker):
     fake_block_hash = "block_hash"
     fake_result = None
 
-    mocked_query = mocker.AsyncMock(return_value=fake_result)
-    subtensor.substrate.query = mocked_query
+    subtensor.substrate.create_storage_key = mocker.AsyncMock(
+        return_value=mocker.Mock(to_hex=mocker.Mock(return_value="0xstorage_key"))
+    )
+    mocked_rpc_request = mocker.AsyncMock(return_value={"result": fake_result})
+    subtensor.substrate.rpc_request = mocked_rpc_request
 
     # Call
     result = await subtensor.get_uid_for_hotkey_on_subnet(
@@ -2133,12 +3220,7 @@ async def test_get_uid_for_hotkey_on_subnet_not_registered(subtensor, mocker):
     )
 
     # Asserts
-    mocked_query.assert_called_once_with(
-        module="SubtensorModule",
-        storage_function="Uids",
-        params=[fake_netuid, fake_hotkey_ss58],
-        block_hash=fake_block_hash,
-    )
+    mocked_rpc_request.assert_called_once()
     assert result is None
 
 
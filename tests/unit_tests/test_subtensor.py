@@ -209,6 +209,8 @@ def test_argument_error_handling(monkeypatch, parser):
         ),
         ("127.0.0.1", "local", "127.0.0.1"),
         ("localhost", "local", "localhost"),
+        ("ws://127.0.0.1:9946", "local", "ws://127.0.0.1:9946"),
+        ("localhost:9944", "local", "localhost:9944"),
         # Edge cases
         (None, None, None),
         ("unknown", "unknown", "unknown"),
@@ -1599,7 +1601,10 @@ def test_get_commitment(subtensor, mocker):
 
     mocked_metagraph = mocker.MagicMock()
     subtensor.metagraph = mocked_metagraph
-    mocked_metagraph.return_value.hotkeys = {fake_uid: fake_hotkey}
+    mocked_query_subtensor = mocker.MagicMock(
+        return_value=mocker.Mock(value=fake_hotkey)
+    )
+    subtensor.query_subtensor = mocked_query_subtensor
 
     mocked_get_metadata = mocker.patch.object(subtensor_module, "get_metadata")
     mocked_get_metadata.return_value = {
@@ -1612,7 +1617,13 @@ def test_get_commitment(subtensor, mocker):
     )
 
     # Assertions
-    mocked_metagraph.assert_called_once_with(fake_netuid)
+    mocked_metagraph.assert_not_called()
+    mocked_query_subtensor.assert_called_once_with(
+        "Keys", fake_block, [fake_netuid, fake_uid]
+    )
+    mocked_get_metadata.assert_called_once_with(
+        subtensor, fake_netuid, fake_hotkey, fake_block
+    )
     assert result == expected_result
 
 
@@ -0,0 +1,220 @@
+import json
+
+import pytest
+
+from bittensor.utils import async_substrate_interface
+
+
+@pytest.mark.asyncio
+async def test_query_map_result_fetch_all_after_partial_iteration(mocker):
+    """Tests fetch_all returns the buffered records left by partial iteration, then the remaining pages."""
+    # Preps
+    fake_substrate = mocker.AsyncMock()
+    fake_substrate.query_map.side_effect = [
+        mocker.Mock(records=[("k4", 4), ("k5", 5)], last_key="k5"),
+        mocker.Mock(records=[], last_key=None),
+    ]
+    result = async_substrate_interface.QueryMapResult(
+        records=[("k1", 1), ("k2", 2), ("k3", 3)],
+        page_size=3,
+        substrate=fake_substrate,
+        module="SubtensorModule",
+        storage_function="Bonds",
+        last_key="k3",
+    )
+    first = await result.__anext__()
+
+    # Call
+    remaining = await result.fetch_all()
+
+    # Asserts
+    assert first == ("k1", 1)
+    assert remaining == [("k2", 2), ("k3", 3), ("k4", 4), ("k5", 5)]
+    assert fake_substrate.query_map.await_count == 2
+    assert fake_substrate.query_map.await_args_list[0].kwargs["start_key"] == "k3"
+    assert result.loading_complete is True
+    assert [record async for record in result] == []
+
+
+@pytest.mark.asyncio
+async def test_subscribe_block_headers(mocker):
+    """Tests subscribe_block_headers skips the confirmation and hands every pushed header to the handler."""
+    # Preps
+    substrate = async_substrate_interface.AsyncSubstrateInterface("ws://fake")
+    mocker.patch.object(substrate, "init_runtime")
+    mocker.patch.object(substrate, "rpc_request")
+    fake_ws = mocker.MagicMock()
+    fake_ws.__aenter__.return_value = fake_ws
+    fake_ws.send = mocker.AsyncMock(return_value=0)
+    fake_ws.retrieve = mocker.AsyncMock(
+        side_effect=[
+            {"jsonrpc": "2.0", "id": 0, "result": "sub-id"},
+            {
+                "jsonrpc": "2.0",
+                "method": "chain_newHead",
+                "params": {
+                    "subscription": "sub-id",
+                    "result": {"number": "0x64", "digest": {"logs": []}},
+                },
+            },
+            {
+                "jsonrpc": "2.0",
+                "method": "chain_newHead",
+                "params": {
+                    "subscription": "sub-id",
+                    "result": {"number": "0x65", "digest": {"logs": []}},
+                },
+            },
+        ]
+    )
+    substrate.ws = fake_ws
+    seen = []
+
+    def handler(block, update_nr, subscription_id):
+        seen.append((block["header"]["number"], update_nr, subscription_id))
+        if update_nr == 1:
+            return "done"
+
+    # Call
+    result = await substrate.subscribe_block_headers(handler)
+    await substrate._forgettable_task
+
+    # Asserts
+    assert result == "done"
+    assert seen == [(100, 0, "sub-id"), (101, 1, "sub-id")]
+    assert fake_ws.send.await_args.args[0]["method"] == "chain_subscribeNewHeads"
+    assert [call.args[0] for call in fake_ws.retrieve.await_args_list] == [
+        0,
+        "sub-id",
+        "sub-id",
+    ]
+    substrate.rpc_request.assert_awaited_once_with(
+        "chain_unsubscribeNewHeads", ["sub-id"]
+    )
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        '{"jsonrpc": "2.0", "id": 0, "result": 340282366920938463463374607431768211455}',
+        b'{"jsonrpc": "2.0", "id": 0, "result": 340282366920938463463374607431768211455}',
+    ],
+    ids=["str", "bytes"],
+)
+def test_json_loads_keeps_u128_precision(message):
+    """Tests _json_loads parses u128 numbers as exact integers."""
+    # Call
+    result = async_substrate_interface._json_loads(message)
+
+    # Asserts
+    assert result["result"] == 2**128 - 1
+    assert isinstance(result["result"], int)
+
+
+def test_json_loads_long_number_skips_orjson(mocker):
+    """Tests _json_loads hands messages with a number wider than 64 bits to the standard library parser."""
+    # Preps
+    mocked_orjson = mocker.patch.object(async_substrate_interface, "orjson")
+    mocked_json_loads = mocker.spy(async_substrate_interface.json, "loads")
+    message = json.dumps({"id": 0, "result": 2**64})
+
+    # Call
+    result = async_substrate_interface._json_loads(message)
+
+    # Asserts
+    assert result == {"id": 0, "result": 2**64}
+    mocked_orjson.loads.assert_not_called()
+    mocked_json_loads.assert_called_once_with(message)
+
+
+def test_json_loads_short_numbers_use_orjson(mocker):
+    """Tests _json_loads parses messages without long numbers with orjson when it is installed."""
+    # Preps
+    mocked_orjson = mocker.patch.object(async_substrate_interface, "orjson")
+    message = '{"id": 0, "result": 18446744073709551}'
+
+    # Call
+    result = async_substrate_interface._json_loads(message)
+
+    # Asserts
+    assert result == mocked_orjson.loads.return_value
+    mocked_orjson.loads.assert_called_once_with(message)
+
+
+def test_json_loads_without_orjson(mocker):
+    """Tests _json_loads falls back to the standard library parser when orjson is not installed."""
+    # Preps
+    mocker.patch.object(async_substrate_interface, "orjson", None)
+
+    # Call
+    result = async_substrate_interface._json_loads('{"id": 0, "result": 1}')
+
+    # Asserts
+    assert result == {"id": 0, "result": 1}
+
+
+def _fake_rpc_websocket(mocker, responses: dict):
+    """Returns a websocket mock that assigns ids in send order and answers each id from ``responses``."""
+    fake_ws = mocker.MagicMock()
+    fake_ws.__aenter__.return_value = fake_ws
+    fake_ws.send = mocker.AsyncMock(side_effect=range(len(responses)))
+    fake_ws.retrieve = mocker.AsyncMock(side_effect=lambda item_id: responses[item_id])
+    return fake_ws
+
+
+@pytest.mark.asyncio
+async def test_rpc_batch_request(mocker):
+    """Tests rpc_batch_request sends every request before awaiting, and returns responses in request order."""
+    # Preps
+    substrate = async_substrate_interface.AsyncSubstrateInterface("ws://fake")
+    fake_ws = _fake_rpc_websocket(
+        mocker,
+        {
+            0: {"jsonrpc": "2.0", "id": 0, "result": "0x00"},
+            1: {"jsonrpc": "2.0", "id": 1, "result": "0x01"},
+            2: {"jsonrpc": "2.0", "id": 2, "result": "0x02"},
+        },
+    )
+    substrate.ws = fake_ws
+
+    # Call
+    result = await substrate.rpc_batch_request(
+        [
+            ("state_call", ["Api_a", "0x"]),
+            ("state_call", ["Api_b", "0x"]),
+            ("state_call", ["Api_a", "0x"]),
+        ],
+        block_hash="block_hash",
+    )
+
+    # Asserts
+    assert [response["result"] for response in result] == ["0x00", "0x01", "0x02"]
+    assert [call.args[0]["params"] for call in fake_ws.send.await_args_list] == [
+        ["Api_a", "0x", "block_hash"],
+        ["Api_b", "0x", "block_hash"],
+        ["Api_a", "0x", "block_hash"],
+    ]
+    assert fake_ws.send.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_rpc_batch_request_raises_on_error(mocker):
+    """Tests rpc_batch_request raises SubstrateRequestException when any request returns an error."""
+    # Preps
+    substrate = async_substrate_interface.AsyncSubstrateInterface("ws://fake")
+    substrate.ws = _fake_rpc_websocket(
+        mocker,
+        {
+            0: {"jsonrpc": "2.0", "id": 0, "result": "0x00"},
+            1: {"jsonrpc": "2.0", "id": 1, "error": {"message": "boom"}},
+        },
+    )
+
+    # Call
+    with pytest.raises(async_substrate_interface.SubstrateRequestException) as error:
+        await substrate.rpc_batch_request(
+            [("state_call", ["Api_a", "0x"]), ("state_call", ["Api_b", "0x"])]
+        )
+
+    # Asserts
+    assert str(error.value) == "boom"
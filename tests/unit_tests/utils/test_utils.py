@@ -30,6 +30,7 @@ def test_ss58_to_vec_u8(mocker):
     mocked_ss58_address_to_bytes = mocker.patch.object(
         utils, "ss58_address_to_bytes", return_value=fake_return
     )
+    utils._ss58_to_u8_tuple.cache_clear()
 
     # Call
     result = utils.ss58_to_vec_u8(test_ss58_address)
@@ -37,6 +38,28 @@ def test_ss58_to_vec_u8(mocker):
     # Asserts
     mocked_ss58_address_to_bytes.assert_called_once_with(test_ss58_address)
     assert result == [int(byte) for byte in fake_return]
+    utils._ss58_to_u8_tuple.cache_clear()
+
+
+def test_ss58_to_vec_u8_is_cached(mocker):
+    """Tests `utils.ss58_to_vec_u8` decodes each address once and returns fresh lists."""
+    # Prep
+    test_ss58_address = "5DD26kC2kxajmwfbbZmVmxhrY9VeeyR1Gpzy9i8wxLUg6zxm"
+    fake_return = b"2\xa6?"
+    mocked_ss58_address_to_bytes = mocker.patch.object(
+        utils, "ss58_address_to_bytes", return_value=fake_return
+    )
+    utils._ss58_to_u8_tuple.cache_clear()
+
+    # Call
+    first = utils.ss58_to_vec_u8(test_ss58_address)
+    first.append(0)
+    second = utils.ss58_to_vec_u8(test_ss58_address)
+
+    # Asserts
+    mocked_ss58_address_to_bytes.assert_called_once_with(test_ss58_address)
+    assert second == list(fake_return)
+    utils._ss58_to_u8_tuple.cache_clear()
 
 
 @pytest.mark.parametrize(